@@ -5,7 +5,7 @@ a = Analysis(
     ['lyrics_fetcher.py'],
     pathex=['/Users/ibridgezhao/Documents/Bjork/.venv/lib/python3.14/site-packages/aeosa'],
     binaries=[],
-    datas=[('MyIcon.iconset/icon_128x128@2x.png', '.')],
+    datas=[('MyIcon.iconset/icon_128x128@2x.png', '.'), ('web/dist', 'web/dist'), ('web/theme.json', 'web')],
     hiddenimports=['appscript', 'aeosa'],
     hookspath=[],
     hooksconfig={},
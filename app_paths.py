@@ -0,0 +1,52 @@
+"""Locations of the app's persistent data files, bundled resources and settings read from .env."""
+
+import os
+import sys
+
+# Directory holding caches, stats and manifests. Kept separate from the
+# legacy ~/.azathoths_whisper_config file, which is a plain file.
+APP_DATA_DIR = os.path.expanduser(os.getenv("AZATHOTH_DATA_DIR", "~/.azathoths_whisper"))
+
+
+def data_path(filename):
+    """Returns the absolute path of a file inside the app data dir, creating the dir if needed."""
+    try:
+        os.makedirs(APP_DATA_DIR, exist_ok=True)
+    except Exception as e:
+        print(f"Failed to create data directory {APP_DATA_DIR}: {e}")
+    return os.path.join(APP_DATA_DIR, filename)
+
+
+def resource_path(relative_path):
+    """
+    Absolute path of a file shipped with the app: next to the sources in a checkout,
+    inside the PyInstaller bundle (_MEIPASS, the executable dir or Contents/Resources) when frozen.
+    """
+    if getattr(sys, 'frozen', False):
+        executable_dir = os.path.dirname(sys.executable)
+        bases = [getattr(sys, '_MEIPASS', None), executable_dir,
+                 os.path.join(os.path.dirname(executable_dir), "Resources")]
+    else:
+        bases = [os.path.dirname(os.path.abspath(__file__))]
+    bases = [b for b in bases if b]
+    for base in bases:
+        path = os.path.join(base, relative_path)
+        if os.path.exists(path):
+            return path
+    return os.path.join(bases[0], relative_path)
+
+
+def env_int(name, default):
+    """Reads an integer setting from the environment (.env), falling back to default."""
+    try:
+        return int(os.getenv(name, default))
+    except (TypeError, ValueError):
+        return default
+
+
+def env_float(name, default):
+    """Reads a float setting from the environment (.env), falling back to default."""
+    try:
+        return float(os.getenv(name, default))
+    except (TypeError, ValueError):
+        return default
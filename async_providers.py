@@ -0,0 +1,449 @@
+"""
+Genius and DarkLyrics providers plus the pipeline that runs registered providers
+on one background event loop.
+
+Uses httpx.AsyncClient when installed; otherwise each provider runs its
+blocking (sync) fetcher in a worker thread, so the pipeline works either way.
+HTML parsing is shared with the sync fetchers through the `parsers` object
+(LyricsFetcher), which must provide:
+    _scrape_genius_html(html) -> str | None
+    _darklyrics_url_from_ddg(html) -> str | None
+    _split_darklyrics_album(html) -> dict | None
+    _match_darklyrics_song(songs, title) -> str | None   (fuzzy, within the target album)
+    _exact_darklyrics_song(songs, title) -> str | None   (exact normalized title, across albums)
+    _fetch_genius_remote / _fetch_darklyrics_remote (sync fallbacks returning LyricsResult)
+"""
+
+import asyncio
+import concurrent.futures
+import re
+import threading
+import time
+
+from app_paths import env_float
+from http_sessions import HTTP
+from lyrics_cache import ALBUM_PAGE_CACHE, LYRICS_CACHE
+from providers import LyricsProvider, LyricsResult, LyricsStatus
+
+
+def _load_httpx():
+    # Imported when the loop starts, not at app start: httpx is slow to import
+    try:
+        import httpx
+        return httpx
+    except ImportError:
+        return None
+
+# Defaults (overridable via .env)
+DEFAULT_REQUEST_TIMEOUT = 30   # per HTTP request of the shared httpx client
+LOOKUP_MARGIN = 2              # seconds over the providers' timeouts for a sequential lookup to settle
+# LYRICS_LOOKUP_TIMEOUT: fixed budget for a sequential lookup (default: the providers' timeouts added up)
+DEFAULT_LATENCY_BUDGET = 12    # LYRICS_LATENCY_BUDGET: budget for a raced lookup
+DEFAULT_PREFERENCE_GRACE = 0.5 # LYRICS_PREFERENCE_GRACE: how long a less preferred answer waits for a better one
+
+
+class AsyncThrottle:
+    """
+    asyncio counterpart of http_sessions.HostThrottle. Shares its token buckets,
+    so sync and async lookups draw from the same per-host rate budget.
+    """
+
+    def __init__(self, host_throttle):
+        self.host_throttle = host_throttle
+        self._semaphores = {}
+
+    async def request(self, client, method, url, **kwargs):
+        limit = self.host_throttle.limit_for(url)
+        if limit is None:
+            return await client.request(method, url, **kwargs)
+        suffix, concurrency, _, bucket = limit
+        # Semaphores are created lazily so they bind to the running loop
+        semaphore = self._semaphores.setdefault(suffix, asyncio.Semaphore(concurrency))
+        async with semaphore:
+            while True:
+                wait = bucket.reserve()
+                if wait <= 0:
+                    break
+                await asyncio.sleep(wait)
+            return await client.request(method, url, **kwargs)
+
+
+class ParsedSiteProvider(LyricsProvider):
+    """Provider backed by LyricsFetcher's sync fetcher and HTML parsers."""
+
+    def __init__(self, parsers):
+        self.parsers = parsers
+
+    def map_status(self, result):
+        """Maps a sync LyricsFetcher LyricsResult onto the provider contract."""
+        if result.found:
+            return result.text
+        if result.status is LyricsStatus.NOT_FOUND:
+            return None
+        raise LookupError(result.error)
+
+
+class GeniusProvider(ParsedSiteProvider):
+    """Genius API search + song page scrape."""
+    name = "genius"
+    timeout = 12
+    priority = 10
+
+    def __init__(self, parsers, token_getter):
+        super().__init__(parsers)
+        self.token_getter = token_getter
+
+    def token(self):
+        token = self.token_getter()
+        if not token or token == "INSERT_YOUR_GENIUS_ACCESS_TOKEN_HERE":
+            raise LookupError("Genius Access Token not configured.")
+        return token
+
+    def fetch_sync(self, artist, title, album=""):
+        return self.map_status(self.parsers._fetch_genius_remote(artist, title, self.token()))
+
+    async def fetch(self, pipeline, artist, title, album=""):
+        token = self.token()
+        if pipeline.client is None:
+            return await asyncio.to_thread(self.fetch_sync, artist, title, album)
+
+        resp = await pipeline.request(
+            "GET", "https://api.genius.com/search",
+            params={'q': f'{title} {artist}'},
+            headers={'Authorization': f'Bearer {token}'})
+        resp.raise_for_status()
+        hits = resp.json()['response']['hits']
+        if not hits:
+            return None
+
+        song_url = hits[0]['result']['url']
+        page = await pipeline.request("GET", song_url)
+        page.raise_for_status()
+        lyrics = self.parsers._scrape_genius_html(page.text)
+        if not lyrics:
+            raise LookupError(f"Could not scrape lyrics from {song_url}")
+        return lyrics
+
+
+class DarkLyricsProvider(ParsedSiteProvider):
+    """DarkLyrics direct album URL, falling back to a DuckDuckGo Lite search."""
+    name = "darklyrics"
+    timeout = 25
+    priority = 20
+    confidence = 0.9
+    uses_album = True
+
+    def fetch_sync(self, artist, title, album=""):
+        return self.map_status(self.parsers._fetch_darklyrics_remote(artist, title, album))
+
+    async def _album_songs(self, pipeline, url):
+        found, songs = ALBUM_PAGE_CACHE.peek(url)
+        if found:
+            return songs
+        resp = await pipeline.request("GET", url)
+        if resp.status_code in (403, 503):
+            # Cloudflare challenge: only the sync cloudscraper client can solve it
+            raise PermissionError(f"Cloudflare challenge on {url}")
+        songs = self.parsers._split_darklyrics_album(resp.text) if resp.status_code == 200 else None
+        ALBUM_PAGE_CACHE.store(url, songs)
+        return songs
+
+    async def fetch(self, pipeline, artist, title, album=""):
+        if pipeline.client is None:
+            return await asyncio.to_thread(self.fetch_sync, artist, title, album)
+        try:
+            return await self._fetch_async(pipeline, artist, title, album)
+        except PermissionError as e:
+            print(f"DEBUG: {e}, retrying with cloudscraper")
+            return await asyncio.to_thread(self.fetch_sync, artist, title, album)
+
+    async def _fetch_async(self, pipeline, artist, title, album):
+        norm_artist = re.sub(r'[^a-z0-9]', '', artist.lower())
+
+        # Strategy 1: Direct URL Construction
+        norm_album = re.sub(r'[^a-z0-9]', '', (album or "").lower())
+        if norm_artist and norm_album:
+            songs = await self._album_songs(pipeline, f"http://www.darklyrics.com/lyrics/{norm_artist}/{norm_album}.html")
+            if songs is not None:
+                return self.parsers._match_darklyrics_song(songs, title) or None
+
+        # Albums of this artist already downloaded
+        if norm_artist:
+            for songs in ALBUM_PAGE_CACHE.albums_matching(f"/lyrics/{norm_artist}/"):
+                lyrics = self.parsers._exact_darklyrics_song(songs, title)
+                if lyrics:
+                    return lyrics
+
+        # Strategy 2: Search via DuckDuckGo Lite
+        query = f'site:darklyrics.com "{artist}" "{title}"'
+        resp = await pipeline.request(
+            "POST", "https://lite.duckduckgo.com/lite/", data={'q': query},
+            headers={'Referer': 'https://lite.duckduckgo.com/'})
+        if resp.status_code != 200:
+            resp = await pipeline.request("GET", "https://lite.duckduckgo.com/lite/", params={'q': query})
+        if resp.status_code != 200:
+            raise LookupError("Could not search for song (DDG Lite Blocked).")
+
+        album_url = self.parsers._darklyrics_url_from_ddg(resp.text)
+        if not album_url:
+            return None
+        songs = await self._album_songs(pipeline, album_url)
+        if songs is None:
+            raise LookupError(f"Could not load DarkLyrics album page {album_url}")
+        return self.parsers._match_darklyrics_song(songs, title) or None
+
+
+class AsyncLyricsPipeline:
+    """
+    Owns a background event loop (+ shared httpx client) and runs the registry's
+    providers on it, feeding observed hit rates/latencies back into the registry.
+    Coroutine API: lookup(), race(). Sync facade: fetch(), fetch_race().
+    """
+
+    def __init__(self, registry, validator=None, timeout=None, latency_budget=None, preference_grace=None):
+        self.registry = registry
+        self.validator = validator or (lambda text: bool(text and text.strip()))
+        self.timeout = timeout or env_float("LYRICS_LOOKUP_TIMEOUT", 0) or None
+        self.latency_budget = latency_budget or env_float("LYRICS_LATENCY_BUDGET", DEFAULT_LATENCY_BUDGET)
+        self.preference_grace = preference_grace if preference_grace is not None else \
+            env_float("LYRICS_PREFERENCE_GRACE", DEFAULT_PREFERENCE_GRACE)
+        self.client = None
+        self.throttle = AsyncThrottle(HTTP.throttle)
+        self._loop = None
+        self._thread = None
+        self._lock = threading.Lock()
+
+    # --- event loop ---
+
+    def _ensure_loop(self):
+        with self._lock:
+            if self._loop is None:
+                self._loop = asyncio.new_event_loop()
+                ready = threading.Event()
+
+                def run():
+                    asyncio.set_event_loop(self._loop)
+                    httpx = _load_httpx()
+                    if httpx is not None:
+                        self.client = httpx.AsyncClient(
+                            timeout=DEFAULT_REQUEST_TIMEOUT, follow_redirects=True,
+                            limits=httpx.Limits(max_connections=20, max_keepalive_connections=10))
+                    ready.set()
+                    self._loop.run_forever()
+
+                self._thread = threading.Thread(target=run, name="lyrics-async", daemon=True)
+                self._thread.start()
+                ready.wait()
+            return self._loop
+
+    def submit(self, coro):
+        """Schedules a coroutine on the pipeline loop; returns a concurrent.futures.Future."""
+        return asyncio.run_coroutine_threadsafe(coro, self._ensure_loop())
+
+    async def request(self, method, url, **kwargs):
+        """Rate-limited request through the shared httpx client."""
+        return await self.throttle.request(self.client, method, url, **kwargs)
+
+    # --- coroutine API ---
+
+    async def run_provider(self, provider, artist, title, album="", genre=None):
+        """
+        Runs one provider with its timeout and the shared lyrics cache.
+        Returns (LyricsResult, error or None); on error the result has status ERROR / TIMEOUT.
+        Cache and stats I/O (SQLite) runs in worker threads, so it never stalls the other
+        providers of a race on the loop.
+        """
+        cache_album = album if provider.uses_album else ""
+        cached = await asyncio.to_thread(LYRICS_CACHE.get, provider.name, artist, title, cache_album)
+        if cached is not None:
+            result = LyricsResult(cached.lyrics if cached.found else "", provider.name, provider.confidence, cached=True)
+            result.timings[provider.name] = 0.0
+            return result, None
+
+        started = time.monotonic()
+        try:
+            found = await asyncio.wait_for(provider.fetch(self, artist, title, album), provider.timeout)
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            latency = time.monotonic() - started
+            await asyncio.to_thread(self.registry.record, provider.name, artist, genre, False, latency)
+            status = LyricsStatus.TIMEOUT if isinstance(e, asyncio.TimeoutError) else LyricsStatus.ERROR
+            result = LyricsResult.failed(str(e) or "timed out", provider.name, status)
+            result.latency = latency
+            result.timings[provider.name] = latency
+            return result, e
+
+        latency = time.monotonic() - started
+        result = found if isinstance(found, LyricsResult) else LyricsResult(found, provider.name, provider.confidence)
+        result.source = provider.name
+        result.latency = latency
+        result.timings[provider.name] = latency
+        await asyncio.to_thread(self._store, provider, artist, title, cache_album, genre, result)
+        return result, None
+
+    def _store(self, provider, artist, title, cache_album, genre, result):
+        """Records the outcome in the provider stats and the lyrics cache (blocking SQLite writes)."""
+        self.registry.record(provider.name, artist, genre, result.found, result.latency)
+        if result.found:
+            LYRICS_CACHE.put(provider.name, artist, title, result.text, cache_album)
+        elif result.status is LyricsStatus.NOT_FOUND:
+            LYRICS_CACHE.put_miss(provider.name, artist, title, cache_album)
+
+    def is_valid(self, result):
+        """A raced answer only wins if it is real lyrics text."""
+        return result.found and self.validator(result.text)
+
+    @staticmethod
+    def _combine(results, latency):
+        """
+        Final result when no provider answered: NOT_FOUND if any provider said so
+        definitively, otherwise the failure (TIMEOUT only if every provider timed out).
+        """
+        timings = {}
+        for r in results:
+            timings.update(r.timings)
+        if not results or any(r.status is LyricsStatus.NOT_FOUND for r in results):
+            combined = LyricsResult.not_found()
+        elif all(r.status is LyricsStatus.TIMEOUT for r in results):
+            combined = LyricsResult.failed("All providers timed out", status=LyricsStatus.TIMEOUT)
+        else:
+            combined = LyricsResult.failed("; ".join(f"{r.source}: {r.error}" for r in results))
+        combined.cached = bool(results) and all(r.cached for r in results)
+        combined.latency = latency
+        combined.timings = timings
+        return combined
+
+    async def lookup(self, artist, title, album="", providers=None, genre=None):
+        """Tries providers in adaptive order. Returns a LyricsResult (status tells why if nothing found)."""
+        started = time.monotonic()
+        results = []
+        for name in self.registry.ordered(artist, genre, providers):
+            provider = self.registry.get(name)
+            result, error = await self.run_provider(provider, artist, title, album, genre)
+            if error is not None:
+                print(f"DEBUG: {name} failed after {result.latency:.1f}s: {error}")
+            if self.is_valid(result):
+                for earlier in results:
+                    result.timings.update(earlier.timings)
+                result.latency = time.monotonic() - started
+                return result
+            results.append(result)
+        return self._combine(results, time.monotonic() - started)
+
+    async def race(self, artist, title, album="", providers=None, genre=None, budget=None, grace=None):
+        """
+        Starts all providers at once and returns the first valid answer, cancelling the rest.
+        A less preferred provider's answer waits up to `grace` seconds for a more preferred
+        one still running; nothing waits past `budget`. Returns a LyricsResult.
+        """
+        loop = asyncio.get_running_loop()
+        names = self.registry.ordered(artist, genre, providers)
+        rank = {name: i for i, name in enumerate(names)}
+        budget = budget or self.latency_budget
+        grace = self.preference_grace if grace is None else grace
+
+        tasks = {asyncio.ensure_future(self.run_provider(self.registry.get(n), artist, title, album, genre)): n
+                 for n in names}
+        pending = set(tasks)
+        deadline = loop.time() + budget
+        grace_deadline = None
+        best = None  # (rank, LyricsResult)
+        results = []
+        started = loop.time()
+        try:
+            while pending:
+                wait = deadline - loop.time()
+                if grace_deadline is not None:
+                    wait = min(wait, grace_deadline - loop.time())
+                if wait <= 0:
+                    break
+                done, pending = await asyncio.wait(pending, timeout=wait, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    name = tasks[task]
+                    result, error = task.result()
+                    results.append(result)
+                    if error is not None:
+                        print(f"DEBUG: race: {name} failed: {error}")
+                    elif self.is_valid(result) and (best is None or rank[name] < best[0]):
+                        best = (rank[name], result)
+                        print(f"DEBUG: race: {name} answered after {loop.time() - started:.2f}s")
+                if best is not None:
+                    # Done once nothing still running is preferred over the current answer
+                    if not any(rank[tasks[t]] < best[0] for t in pending):
+                        break
+                    if grace_deadline is None:
+                        grace_deadline = loop.time() + grace
+        finally:
+            for task in pending:
+                task.cancel()
+        if best is None:
+            if pending:
+                # Providers still running at the budget count as timed out
+                results.extend(LyricsResult.failed("latency budget exceeded", tasks[t], LyricsStatus.TIMEOUT)
+                               for t in pending)
+            return self._combine(results, loop.time() - started)
+        winner = best[1]
+        for r in results:
+            winner.timings.update(r.timings)
+        winner.latency = loop.time() - started
+        return winner
+
+    # --- sync facade ---
+
+    def lookup_budget(self, providers=None):
+        """
+        Seconds a sequential lookup may take: each provider is asked in turn for up to its
+        own timeout, so the budget is their sum (or LYRICS_LOOKUP_TIMEOUT if set).
+        """
+        if self.timeout:
+            return self.timeout
+        asked = [self.registry.get(name) for name in (providers or self.registry.names())]
+        return sum(p.timeout for p in asked if p is not None) + LOOKUP_MARGIN
+
+    def fetch(self, artist, title, album="", providers=None, genre=None, timeout=None):
+        """Blocking lookup for callers on other threads (e.g. the pywebview bridge)."""
+        future = self.submit(self.lookup(artist, title, album, providers, genre))
+        try:
+            return future.result(timeout or self.lookup_budget(providers))
+        except Exception as e:
+            future.cancel()
+            print(f"DEBUG: Async lookup failed or timed out: {e!r}")
+            # Not the builtin TimeoutError before Python 3.11
+            timed_out = isinstance(e, (concurrent.futures.TimeoutError, TimeoutError))
+            status = LyricsStatus.TIMEOUT if timed_out else LyricsStatus.ERROR
+            return LyricsResult.failed(str(e) or "lookup timed out", status=status)
+
+    def fetch_race(self, artist, title, album="", providers=None, genre=None, budget=None):
+        """Blocking race() for callers on other threads."""
+        budget = budget or self.latency_budget
+        future = self.submit(self.race(artist, title, album, providers, genre, budget))
+        try:
+            # Small margin over the budget for cancellation to settle
+            return future.result(budget + 2)
+        except Exception as e:
+            future.cancel()
+            print(f"DEBUG: Raced lookup failed or timed out: {e!r}")
+            timed_out = isinstance(e, (concurrent.futures.TimeoutError, TimeoutError))
+            status = LyricsStatus.TIMEOUT if timed_out else LyricsStatus.ERROR
+            return LyricsResult.failed(str(e) or "lookup timed out", status=status)
+
+    def close(self):
+        """Cancels outstanding lookups and stops the loop."""
+        loop = self._loop
+        if loop is None:
+            return
+
+        async def shutdown():
+            for task in asyncio.all_tasks():
+                if task is not asyncio.current_task():
+                    task.cancel()
+            if self.client is not None:
+                await self.client.aclose()
+
+        try:
+            asyncio.run_coroutine_threadsafe(shutdown(), loop).result(5)
+        except Exception:
+            pass
+        loop.call_soon_threadsafe(loop.stop)
+        self._loop = None
@@ -0,0 +1,122 @@
+"""Concurrent batch lyrics fetching on a bounded thread pool."""
+
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from app_paths import env_int
+
+# Default worker count (overridable via .env: BATCH_MAX_WORKERS).
+# Per-host limits in http_sessions.HOST_LIMITS keep each provider polite.
+DEFAULT_MAX_WORKERS = 6
+
+
+class BatchItemResult:
+    """Outcome of one batch item, reported to on_progress in input order."""
+    __slots__ = ("index", "item", "result", "error", "elapsed", "done", "total")
+
+    def __init__(self, index, item, result, error, elapsed, done, total):
+        self.index = index
+        self.item = item
+        self.result = result
+        self.error = error
+        self.elapsed = elapsed
+        self.done = done
+        self.total = total
+
+
+class BatchFetchEngine:
+    """
+    Runs `fetch(item)` for every item on a bounded thread pool.
+
+    Callbacks (invoked from a background thread; marshal to the UI yourself):
+      on_start(index, item)   - a worker picked up the item (any order)
+      on_progress(BatchItemResult) - strictly in input order
+      on_done(summary_dict)   - once, after the last item or after cancel()
+    """
+
+    def __init__(self, fetch, max_workers=None, on_start=None, on_progress=None, on_done=None):
+        self.fetch = fetch
+        self.max_workers = max_workers or max(1, env_int("BATCH_MAX_WORKERS", DEFAULT_MAX_WORKERS))
+        self.on_start = on_start
+        self.on_progress = on_progress
+        self.on_done = on_done
+        self._cancel = threading.Event()
+        self._finished = threading.Event()
+        self._thread = None
+
+    @property
+    def cancelled(self):
+        return self._cancel.is_set()
+
+    @property
+    def running(self):
+        return self._thread is not None and not self._finished.is_set()
+
+    def start(self, items):
+        """Starts processing in the background and returns immediately."""
+        items = list(items)
+        self._thread = threading.Thread(target=self._run, args=(items,), daemon=True)
+        self._thread.start()
+        return self
+
+    def cancel(self):
+        """Skips items not started yet; in-flight requests finish but are not reported."""
+        self._cancel.set()
+
+    def wait(self, timeout=None):
+        return self._finished.wait(timeout)
+
+    def _call(self, index, item):
+        if self._cancel.is_set():
+            return None, None, 0.0
+        if self.on_start:
+            try:
+                self.on_start(index, item)
+            except Exception as e:
+                print(f"Batch on_start callback failed: {e}")
+        started = time.monotonic()
+        try:
+            return self.fetch(item), None, time.monotonic() - started
+        except Exception as e:
+            print(f"Batch fetch failed for item {index}: {e}")
+            return None, e, time.monotonic() - started
+
+    def _run(self, items):
+        started = time.monotonic()
+        total = len(items)
+        done = 0
+        errors = 0
+        executor = ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix="batch-fetch")
+        try:
+            futures = [executor.submit(self._call, i, item) for i, item in enumerate(items)]
+            # Collect in submission order so progress is reported in input order
+            for index, future in enumerate(futures):
+                if self._cancel.is_set():
+                    break
+                result, error, elapsed = future.result()
+                if self._cancel.is_set():
+                    break
+                done += 1
+                if error is not None:
+                    errors += 1
+                if self.on_progress:
+                    try:
+                        self.on_progress(BatchItemResult(index, items[index], result, error, elapsed, done, total))
+                    except Exception as e:
+                        print(f"Batch on_progress callback failed: {e}")
+        finally:
+            executor.shutdown(wait=False, cancel_futures=True)
+            summary = {
+                "total": total,
+                "done": done,
+                "errors": errors,
+                "cancelled": self._cancel.is_set(),
+                "elapsed": time.monotonic() - started,
+            }
+            self._finished.set()
+            if self.on_done:
+                try:
+                    self.on_done(summary)
+                except Exception as e:
+                    print(f"Batch on_done callback failed: {e}")
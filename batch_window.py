@@ -0,0 +1,285 @@
+"""
+Tk batch window (album or directory mode).
+
+Kept out of lyrics_fetcher so tkinter is only loaded when the window is opened.
+`parent` must provide music_ctrl and resolve(artist, title, album, genre, race).
+"""
+
+import tkinter as tk
+from tkinter import ttk, messagebox, scrolledtext
+
+import library_scanner
+from batch_engine import BatchFetchEngine
+from batch_writer import BatchTagWriter
+from providers import LyricsStatus
+
+
+class BatchProcessingWindow(tk.Toplevel):
+    """Window for batch processing (Album or Directory)."""
+    def __init__(self, parent, mode="album", data=None):
+        super().__init__(parent)
+        self.title("Batch Processing")
+        self.geometry("1000x700")
+        self.configure(bg="#000000") # Set background
+        
+        self.mode = mode
+        self.data = data if data else []
+        self.results_map = {}
+        self.app = parent # Assuming parent is the app instance
+        self.fetch_engine = None
+        self.tag_writer = None
+        
+        title_map = {"album": "Check Current Album", "directory": "Scan Directory"}
+        self.title(title_map.get(mode, "Batch Manager"))
+        self.geometry("1000x700")
+        
+        self.create_widgets()
+        
+        # Start loading data
+        self.status_var.set("Loading data...")
+        self.after(100, self.load_data)
+
+    def create_widgets(self):
+        # Main layout: PanedWindow (List | Preview)
+        paned = ttk.PanedWindow(self, orient=tk.HORIZONTAL)
+        paned.pack(fill=tk.BOTH, expand=True, padx=0, pady=0)
+        
+        # Left Panel: List
+        left_frame = ttk.Frame(paned, padding=0)
+        paned.add(left_frame, weight=2)
+        
+        # Treeview
+        cols = ("Artist", "Title", "Album", "Status")
+        self.tree = ttk.Treeview(left_frame, columns=cols, show='headings', selectmode="extended")
+        self.tree.heading("Artist", text="Artist")
+        self.tree.heading("Title", text="Title")
+        self.tree.heading("Album", text="Album")
+        self.tree.heading("Status", text="Status")
+        
+        self.tree.column("Artist", width=120)
+        self.tree.column("Title", width=150)
+        self.tree.column("Album", width=120)
+        self.tree.column("Status", width=100)
+        
+        self.tree.bind('<<TreeviewSelect>>', self.on_select)
+        
+        scroll = ttk.Scrollbar(left_frame, orient=tk.VERTICAL, command=self.tree.yview)
+        self.tree.configure(yscrollcommand=scroll.set)
+        
+        self.tree.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
+        scroll.pack(side=tk.RIGHT, fill=tk.Y)
+        
+        # Right Panel: Preview & Actions
+        right_frame = ttk.Frame(paned, padding=10)
+        paned.add(right_frame, weight=1)
+        
+        ttk.Label(right_frame, text="Lyrics Preview:", font=("Helvetica", 12, "bold"), foreground="#d41132").pack(anchor=tk.W, pady=(0, 5))
+        self.preview_text = scrolledtext.ScrolledText(right_frame, width=40, height=20, bg="#050505", fg="#aaaaaa", 
+                                                      insertbackground="white", relief="flat", font=("Menlo", 11))
+        self.preview_text.pack(fill=tk.BOTH, expand=True, pady=0)
+        
+        # Action Buttons frame
+        btn_frame = ttk.Frame(self, padding=10)
+        btn_frame.pack(fill=tk.X, padx=0, pady=0)
+        
+        self.status_var = tk.StringVar(value="Ready")
+        ttk.Label(btn_frame, textvariable=self.status_var).pack(side=tk.LEFT)
+        
+        # Buttons
+        ttk.Button(btn_frame, text="Close", command=self.destroy).pack(side=tk.RIGHT, padx=5)
+
+        # Import Selected
+        self.btn_import_selected = ttk.Button(btn_frame, text="IMPORT SELECTED", command=self.import_selected, state="disabled")
+        self.btn_import_selected.pack(side=tk.RIGHT, padx=5)
+
+        # Import All
+        # Always enabled, or enabled checking if any have new_lyrics? For simplicity, always enabled but checking logic handles 0.
+        self.btn_import_all = ttk.Button(btn_frame, text="IMPORT ALL", command=self.import_all)
+        self.btn_import_all.pack(side=tk.RIGHT, padx=5)
+        
+        self.btn_fetch_missing = ttk.Button(btn_frame, text="FETCH MISSING LYRICS", command=self.start_fetch_missing)
+        self.btn_fetch_missing.pack(side=tk.RIGHT, padx=5)
+
+        if self.mode == "directory":
+            # Reports what IMPORT ALL would do to each file without writing
+            ttk.Button(btn_frame, text="DRY RUN", command=self.dry_run_import).pack(side=tk.RIGHT, padx=5)
+
+    def load_data(self):
+        self.tree.delete(*self.tree.get_children())
+        self.results_map = {}
+        
+        items = []
+        if self.mode == "album":
+            items = self.app.music_ctrl.get_album_tracks()
+        elif self.mode == "directory" and self.data:
+            items = list(library_scanner.scan(self.data, manifest=library_scanner.SCAN_MANIFEST))
+            
+        for i, item in enumerate(items):
+            uid = str(i)
+            self.results_map[uid] = item
+            item['new_lyrics'] = ""
+            item.setdefault('has_lyrics', bool(item.get('lyrics', '').strip()))
+            status_str = "Has Lyrics" if item.get('has_lyrics') else "Missing"
+            values = (item.get('artist'), item.get('title'), item.get('album'), status_str)
+            self.tree.insert('', tk.END, iid=uid, values=values)
+            
+        self.status_var.set(f"Loaded {len(items)} tracks.")
+
+    def on_select(self, event):
+        selected = self.tree.selection()
+        if not selected: return
+        
+        uid = selected[0]
+        data = self.results_map.get(uid)
+        if data:
+            self.preview_text.delete("1.0", tk.END)
+            if data.get('new_lyrics'):
+                self.preview_text.insert("1.0", data['new_lyrics'])
+            elif data.get('has_lyrics'):
+                self.preview_text.insert("1.0", "(Existing lyrics present)")
+            else:
+                self.preview_text.insert("1.0", "(No lyrics)")
+            
+            if data.get('new_lyrics'):
+                self.btn_import_selected.config(state="normal")
+            else:
+                 self.btn_import_selected.config(state="disabled")
+
+    def start_fetch_missing(self):
+        missing_ids = []
+        for uid, data in self.results_map.items():
+            if not data.get('has_lyrics') and not data.get('new_lyrics'):
+                missing_ids.append(uid)
+        
+        if not missing_ids:
+            messagebox.showinfo("Info", "No missing lyrics to fetch.")
+            return
+        if self.fetch_engine and self.fetch_engine.running:
+            return
+            
+        self.status_var.set(f"Fetching for {len(missing_ids)} tracks...")
+
+        def fetch(uid):
+            data = self.results_map[uid]
+            return self.app.resolve(data.get('artist', ''), data.get('title', ''), data.get('album', ''),
+                                    genre=data.get('genre'), race=False)
+
+        self.fetch_engine = BatchFetchEngine(
+            fetch,
+            on_start=lambda i, uid: self.after(0, self._set_status, uid, "Fetching..."),
+            on_progress=lambda res: self.after(0, self._on_fetch_progress, res),
+            on_done=lambda summary: self.after(0, self._on_fetch_done, summary),
+        ).start(missing_ids)
+
+    def _set_status(self, uid, text):
+        if self.winfo_exists():
+            self.tree.set(uid, "Status", text)
+
+    def _on_fetch_progress(self, res):
+        """Runs on the Tk thread, in track order."""
+        uid = res.item
+        result = res.result
+        if result and result.found:
+            self.results_map[uid]['new_lyrics'] = result.text
+            self._set_status(uid, f"Found ({result.source})!")
+        elif result and result.status is LyricsStatus.NOT_FOUND:
+            self._set_status(uid, "Not Found")
+        elif result and result.status is LyricsStatus.TIMEOUT:
+            self._set_status(uid, "Timed Out")
+        else:
+            self._set_status(uid, "Error")
+        if self.winfo_exists():
+            self.status_var.set(f"Fetching... {res.done}/{res.total}")
+
+    def _on_fetch_done(self, summary):
+        if self.winfo_exists():
+            self.status_var.set("Fetch cancelled." if summary["cancelled"] else "Fetch complete.")
+
+    def destroy(self):
+        # Closing the window stops queued lookups
+        if self.fetch_engine:
+            self.fetch_engine.cancel()
+        if self.tag_writer:
+            self.tag_writer.cancel()
+        super().destroy()
+
+    def import_selected(self):
+        selected = self.tree.selection()
+        if not selected:
+            messagebox.showinfo("Info", "No tracks selected.")
+            return
+        self._batch_import(selected)
+
+    def import_all(self):
+        # All IDs
+        all_ids = list(self.results_map.keys())
+        self._batch_import(all_ids)
+
+    def dry_run_import(self):
+        self._batch_import(list(self.results_map.keys()), dry_run=True)
+
+    def _batch_import(self, uids, dry_run=False):
+        pending = {uid: self.results_map[uid] for uid in uids
+                   if self.results_map.get(uid) and self.results_map[uid].get('new_lyrics')}
+
+        if self.mode != "album":
+            self._start_file_writes(pending, dry_run)
+            return
+
+        # Album tracks carry their persistent ID as 'id'; resolve all once and write in one batch
+        results = self.app.music_ctrl.set_lyrics_many(
+            {data['id']: data['new_lyrics'] for data in pending.values() if data.get('id')})
+        saved = [uid for uid, data in pending.items() if results.get(data.get('id'))]
+        for uid in saved:
+            self._mark_saved(uid)
+        messagebox.showinfo("Result", f"Updated {len(saved)} tracks.")
+
+    def _mark_saved(self, uid):
+        data = self.results_map[uid]
+        self.tree.set(uid, "Status", "Saved")
+        data['has_lyrics'] = True
+        data['new_lyrics'] = ""
+
+    def _start_file_writes(self, pending, dry_run):
+        """Writes local files on the background tag writer; the Treeview is updated via after()."""
+        items = [(uid, data['path'], data['new_lyrics']) for uid, data in pending.items() if data.get('path')]
+        if not items:
+            messagebox.showinfo("Result", "Nothing to import.")
+            return
+        if self.tag_writer and self.tag_writer.running:
+            return
+        self.status_var.set(f"{'Checking' if dry_run else 'Writing'} {len(items)} files...")
+        self.tag_writer = BatchTagWriter(
+            dry_run=dry_run,
+            on_progress=lambda res: self.after(0, self._on_write_progress, res),
+            on_done=lambda summary: self.after(0, self._on_write_done, summary),
+        ).start(items)
+
+    def _on_write_progress(self, res):
+        """Runs on the Tk thread."""
+        if not self.winfo_exists():
+            return
+        uid = res.item[0]
+        result = res.result
+        if not result:
+            self._set_status(uid, "Write Failed")
+        elif self.tag_writer.dry_run and result.mode == "unchanged":
+            self._set_status(uid, "Unchanged")
+        elif self.tag_writer.dry_run:
+            action = "Replace" if result.had_lyrics else "Add"
+            self._set_status(uid, f"{action} ({'in place' if result.mode == 'in_place' else 'rewrite'})")
+        else:
+            self._mark_saved(uid)
+        self.status_var.set(f"{'Checking' if self.tag_writer.dry_run else 'Writing'}... {res.done}/{res.total}")
+
+    def _on_write_done(self, summary):
+        if not self.winfo_exists():
+            return
+        if summary["dry_run"]:
+            self.status_var.set(f"Dry run: {summary['written']} would change, "
+                                f"{summary['unchanged']} unchanged, {summary['failed']} unreadable.")
+            return
+        self.status_var.set("Write cancelled." if summary["cancelled"] else "Write complete.")
+        messagebox.showinfo("Result", f"Updated {summary['written']} files "
+                                      f"({summary['bytes_written'] / 1048576:.1f} MB written), "
+                                      f"{summary['failed']} failed.")
@@ -0,0 +1,172 @@
+"""
+Background lyrics tag writing for directory imports.
+
+Files are written on a bounded thread pool, with a separate concurrency cap
+per storage device: several threads seeking over one spinning disk are slower
+than one. Transient I/O errors (busy NAS shares, timeouts) are retried with
+back-off. dry_run reports what every write would do without touching files.
+"""
+
+import errno
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from app_paths import env_float, env_int
+from batch_engine import BatchItemResult
+from tag_writer import write_lyrics
+
+# Defaults (overridable via .env: TAG_WRITE_WORKERS, TAG_WRITES_PER_DEVICE,
+# TAG_WRITE_RETRIES, TAG_WRITE_RETRY_DELAY)
+DEFAULT_WORKERS = 4
+DEFAULT_PER_DEVICE = 2
+DEFAULT_RETRIES = 2
+DEFAULT_RETRY_DELAY = 0.5
+
+TRANSIENT_ERRNOS = {errno.EAGAIN, errno.EBUSY, errno.EINTR, errno.EIO, errno.ETIMEDOUT,
+                    getattr(errno, 'ESTALE', errno.EIO)}
+
+
+def device_of(path):
+    """st_dev of the file's folder (the file itself may be replaced by a rename)."""
+    try:
+        return os.stat(os.path.dirname(os.path.abspath(path))).st_dev
+    except OSError:
+        return None
+
+
+def is_rotational(device):
+    """True / False for a Linux block device (sysfs queue/rotational), None if unknown."""
+    if device is None:
+        return None
+    base = f"/sys/dev/block/{os.major(device)}:{os.minor(device)}"
+    # Partitions keep the queue settings on their parent disk
+    for candidate in (os.path.join(base, "queue", "rotational"), os.path.join(base, "..", "queue", "rotational")):
+        try:
+            with open(candidate) as f:
+                return f.read().strip() == "1"
+        except OSError:
+            continue
+    return None
+
+
+class BatchTagWriter:
+    """
+    Writes lyrics into files: items are (key, path, lyrics) tuples.
+
+    Callbacks (invoked from worker threads; marshal to the UI yourself):
+      on_progress(BatchItemResult) - per file as it completes; result is a TagWriteResult
+      on_done(summary_dict)        - once, after the last file or after cancel()
+    """
+
+    def __init__(self, write=write_lyrics, max_workers=None, per_device=None, retries=None,
+                 dry_run=False, on_progress=None, on_done=None):
+        self.write = write
+        self.max_workers = max_workers or max(1, env_int("TAG_WRITE_WORKERS", DEFAULT_WORKERS))
+        self.per_device = per_device or env_int("TAG_WRITES_PER_DEVICE", 0)
+        self.retries = retries if retries is not None else env_int("TAG_WRITE_RETRIES", DEFAULT_RETRIES)
+        self.retry_delay = env_float("TAG_WRITE_RETRY_DELAY", DEFAULT_RETRY_DELAY)
+        self.dry_run = dry_run
+        self.on_progress = on_progress
+        self.on_done = on_done
+        self._devices = {}
+        self._devices_lock = threading.Lock()
+        self._progress_lock = threading.Lock()
+        self._done = 0
+        self._cancel = threading.Event()
+        self._finished = threading.Event()
+        self._thread = None
+
+    @property
+    def running(self):
+        return self._thread is not None and not self._finished.is_set()
+
+    def start(self, items):
+        items = list(items)
+        self._thread = threading.Thread(target=self._run, args=(items,), name="tag-writer", daemon=True)
+        self._thread.start()
+        return self
+
+    def cancel(self):
+        """Skips files not started yet; writes in progress complete."""
+        self._cancel.set()
+
+    def wait(self, timeout=None):
+        return self._finished.wait(timeout)
+
+    def _device_slots(self, path):
+        device = device_of(path)
+        with self._devices_lock:
+            slots = self._devices.get(device)
+            if slots is None:
+                limit = self.per_device
+                if not limit:
+                    rotational = is_rotational(device)
+                    limit = 1 if rotational else (self.max_workers if rotational is False else DEFAULT_PER_DEVICE)
+                slots = self._devices[device] = threading.BoundedSemaphore(limit)
+            return slots
+
+    def _write(self, path, lyrics):
+        result = None
+        for attempt in range(self.retries + 1):
+            result = self.write(path, lyrics, dry_run=self.dry_run)
+            if result or result.errno not in TRANSIENT_ERRNOS or self._cancel.is_set():
+                return result
+            if attempt < self.retries:
+                print(f"DEBUG: Transient error writing {os.path.basename(path)} ({result.error}), retrying")
+                time.sleep(self.retry_delay * (2 ** attempt))
+        return result
+
+    def _call(self, index, item, total):
+        if self._cancel.is_set():
+            return None, None
+        _, path, lyrics = item
+        started = time.monotonic()
+        error = None
+        with self._device_slots(path):
+            if self._cancel.is_set():
+                return None, None
+            try:
+                result = self._write(path, lyrics)
+            except Exception as e:
+                print(f"Tag write failed for {path}: {e}")
+                result, error = None, e
+        with self._progress_lock:
+            self._done += 1
+            report = BatchItemResult(index, item, result, error, time.monotonic() - started, self._done, total)
+        if self.on_progress:
+            try:
+                self.on_progress(report)
+            except Exception as e:
+                print(f"Tag writer on_progress callback failed: {e}")
+        return result, error
+
+    def _run(self, items):
+        started = time.monotonic()
+        total = len(items)
+        results = []
+        executor = ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix="tag-write")
+        try:
+            futures = [executor.submit(self._call, i, item, total) for i, item in enumerate(items)]
+            for future in futures:
+                results.append(future.result())
+        finally:
+            executor.shutdown(wait=False, cancel_futures=True)
+            summary = {
+                "total": total,
+                "done": self._done,
+                "written": sum(1 for r, _ in results if r and r.mode in ("in_place", "rewrite")),
+                "unchanged": sum(1 for r, _ in results if r and r.mode == "unchanged"),
+                "failed": sum(1 for r, e in results if e is not None or (r is not None and not r)),
+                "bytes_written": sum(r.bytes_written for r, _ in results if r),
+                "dry_run": self.dry_run,
+                "cancelled": self._cancel.is_set(),
+                "elapsed": time.monotonic() - started,
+            }
+            self._finished.set()
+            if self.on_done:
+                try:
+                    self.on_done(summary)
+                except Exception as e:
+                    print(f"Tag writer on_done callback failed: {e}")
@@ -0,0 +1,61 @@
+"""MusicController against FakeMusicBackend: Apple Event round trips per call."""
+
+import pytest
+
+ALBUM_TRACKS = 20
+OTHER_TRACKS = 500
+# Simulated cost of one Apple Event (a few ms against a busy Music.app)
+EVENT_LATENCY = 0.002
+
+
+def _library():
+    tracks = [{"persistent_id": f"A{i:04d}", "artist": "Dark Tranquillity", "name": f"Song {i}",
+               "album": "Projector", "genre": "Metal", "lyrics": "" if i % 2 else "Some words"}
+              for i in range(ALBUM_TRACKS)]
+    tracks += [{"persistent_id": f"L{i:05d}", "artist": f"Artist {i % 50}", "name": f"Track {i}",
+                "album": "Projector" if i % 7 == 0 else f"Album {i % 40}", "genre": "", "lyrics": ""}
+               for i in range(OTHER_TRACKS)]
+    return tracks
+
+
+@pytest.fixture
+def music(lf):
+    from music_backend import FakeMusicBackend
+    backend = FakeMusicBackend(_library(), current=3)
+    return backend, lf.MusicController(backend)
+
+
+def test_album_tracks_round_trips(benchmark, music):
+    """A 20-track album: player state, current track, one read per field and the references."""
+    backend, controller = music
+
+    def load():
+        backend.round_trips = 0
+        return controller.get_album_tracks()
+
+    tracks = benchmark(load)
+    assert len(tracks) == ALBUM_TRACKS
+    assert backend.round_trips == 2 + len(controller.TRACK_FIELDS) + 1
+    # Per-track reads cost five events a track, ~100 for this album
+    assert backend.round_trips < 5 * ALBUM_TRACKS // 10
+
+
+def test_album_tracks_with_latency(benchmark, music):
+    """The same load with simulated per-event latency: time scales with events, not tracks."""
+    backend, controller = music
+    backend.latency = EVENT_LATENCY
+    tracks = benchmark.pedantic(controller.get_album_tracks, rounds=10, warmup_rounds=1)
+    assert len(tracks) == ALBUM_TRACKS
+
+
+def test_now_playing_round_trips(benchmark, music):
+    """Now-playing read with lyrics: player state plus one properties record."""
+    backend, controller = music
+
+    def read():
+        backend.round_trips = 0
+        return controller.get_now_playing()
+
+    track = benchmark(read)
+    assert track["title"] == "Song 3"
+    assert backend.round_trips == 2
@@ -0,0 +1,70 @@
+"""Title cleanup, page parsing and the offline end-to-end lookups."""
+
+import json
+
+import pytest
+
+TARGET = "Moment"
+
+
+@pytest.fixture(scope="module")
+def titles(fixture_text):
+    return fixture_text("titles.txt").splitlines()
+
+
+def test_sanitize_title(benchmark, lf, titles):
+    sanitize = lf.LyricsFetcher.sanitize_title
+    cleaned = benchmark(lambda: [sanitize(title) for title in titles])
+    assert len(cleaned) == len(titles)
+    assert sanitize("Moment (Remastered 2009)") == "Moment"
+
+
+def test_parse_darklyrics_page(benchmark, lf, fixture_text):
+    html = fixture_text("darklyrics_album.html")
+    result = benchmark(lf.LyricsFetcher._parse_darklyrics_page, html, TARGET)
+    assert result.found and result.text
+
+
+def test_darklyrics_url_from_ddg(benchmark, lf, fixture_text):
+    html = fixture_text("ddg_lite.html")
+    url = benchmark(lf.LyricsFetcher._darklyrics_url_from_ddg, html)
+    assert url == "https://www.darklyrics.com/lyrics/darktranquillity/projector.html"
+
+
+def test_scrape_genius_html(benchmark, lf, fixture_text):
+    html = fixture_text("genius_song.html")
+    lyrics = benchmark(lf.LyricsFetcher._scrape_genius_html, html)
+    assert lyrics and lyrics.startswith("[Verse 1]")
+
+
+def test_genius_search_json(benchmark, fixture_text):
+    text = fixture_text("genius_search.json")
+    url = benchmark(lambda: json.loads(text)["response"]["hits"][0]["result"]["url"])
+    assert url.endswith("-moment-lyrics")
+
+
+def _clear_caches(lf):
+    lf.LYRICS_CACHE.clear()
+    lf.ALBUM_PAGE_CACHE.clear()
+
+
+def test_lookup_genius_offline(benchmark, lf, pipeline):
+    """Search API + song page scrape through the pipeline, as when lyricsgenius fails (caches emptied every round)."""
+    result = benchmark.pedantic(pipeline.fetch, args=("Dark Tranquillity", TARGET), kwargs={"providers": ["genius"]},
+                                setup=lambda: _clear_caches(lf), rounds=30, warmup_rounds=1)
+    assert result.found and result.source == "genius", result.error
+
+
+def test_lookup_darklyrics_offline(benchmark, lf, pipeline):
+    """DDG Lite search + album page download and split through the pipeline (caches emptied every round)."""
+    result = benchmark.pedantic(pipeline.fetch, args=("Dark Tranquillity", TARGET), kwargs={"providers": ["darklyrics"]},
+                                setup=lambda: _clear_caches(lf), rounds=30, warmup_rounds=1)
+    assert result.found and result.source == "darklyrics", result.error
+
+
+def test_lookup_cached(benchmark, lf, pipeline):
+    """A repeat lookup answered from the lyrics cache (SQLite) by the pipeline."""
+    _clear_caches(lf)
+    assert pipeline.fetch("Dark Tranquillity", TARGET, providers=["genius"]).found
+    result = benchmark(pipeline.fetch, "Dark Tranquillity", TARGET, providers=["genius"])
+    assert result.found and result.cached
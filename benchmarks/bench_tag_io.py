@@ -0,0 +1,83 @@
+"""Directory scans and lyrics tag writes on the generated corpus."""
+
+import itertools
+import os
+import shutil
+
+import pytest
+
+# Short enough for the padding mutagen leaves, so the tag is updated in place
+SHORT_LYRICS = "Ash and light\nA silent veil\n" * 4
+# Larger than any padding: the file is rewritten through a temp copy
+LONG_LYRICS = "Burning glass over the frozen tide, a hollow crown of ember\n" * 400
+
+
+def test_scan_directory_cold(benchmark, lf, corpus):
+    """Every file parsed (no scan manifest)."""
+    directory, files = corpus
+    scan = lambda: list(lf.DirectoryScanner.iter_directory(directory, incremental=False))
+    tracks = benchmark.pedantic(scan, rounds=5, warmup_rounds=1)
+    assert {t['path']: t['has_lyrics'] for t in tracks} == dict(files)
+
+
+def test_scan_directory_incremental(benchmark, lf, corpus):
+    """scan_directory on an unchanged folder: served from the manifest after the first walk."""
+    directory, files = corpus
+    lf.DirectoryScanner.scan_directory(directory)
+    tracks = benchmark(lf.DirectoryScanner.scan_directory, directory)
+    assert len(tracks) == len(files)
+
+
+def test_probe_lyrics(benchmark, corpus):
+    """Header-only has-lyrics check (tag_probe) over the whole corpus."""
+    from tag_probe import probe_lyrics
+    files = corpus[1]
+    found = benchmark(lambda: [probe_lyrics(path) for path, _ in files])
+    assert found == [has_lyrics for _, has_lyrics in files]
+
+
+def test_check_lyrics_mutagen(benchmark, corpus):
+    """The same check through a full mutagen parse, the probe's fallback and baseline."""
+    import mutagen
+    import library_scanner
+    files = corpus[1]
+
+    def check(path):
+        audio = mutagen.File(path)
+        return bool(audio) and library_scanner.has_lyrics(audio)
+
+    found = benchmark(lambda: [check(path) for path, _ in files])
+    assert found == [has_lyrics for _, has_lyrics in files]
+
+
+def _template(corpus, ext, with_lyrics):
+    for path, has_lyrics in corpus[1]:
+        if path.endswith(ext) and has_lyrics == with_lyrics:
+            return path
+    pytest.skip(f"no {ext} file in the corpus")
+
+
+@pytest.mark.parametrize("ext", [".mp3", ".m4a", ".flac"])
+@pytest.mark.parametrize("lyrics, mode", [(SHORT_LYRICS, "in_place"), (LONG_LYRICS, "rewrite")],
+                         ids=["in_place", "rewrite"])
+def test_write_lyrics_to_file(benchmark, lf, corpus, tmp_path, ext, lyrics, mode):
+    """Writes into a fresh copy of a corpus file (without lyrics) each round; the copy is not timed."""
+    template = _template(corpus, ext, with_lyrics=False)
+    counter = itertools.count()
+    results = []
+
+    def setup():
+        # The previous round's copy goes first, so tmp_path stays small
+        for name in os.listdir(tmp_path):
+            os.remove(os.path.join(tmp_path, name))
+        path = os.path.join(tmp_path, f"round{next(counter)}{ext}")
+        shutil.copyfile(template, path)
+        return (path, lyrics), {}
+
+    def write(path, text):
+        result = lf.DirectoryScanner.write_lyrics_to_file(path, text)
+        results.append(result)
+        return result
+
+    benchmark.pedantic(write, setup=setup, rounds=20, warmup_rounds=1)
+    assert all(results) and {r.mode for r in results} == {mode}
@@ -0,0 +1,88 @@
+"""TrackWatcher driven by FakeNotificationSource: push latency and the paused polling back-off."""
+
+import threading
+import time
+
+import pytest
+
+from track_watcher import FakeNotificationSource, TrackState, TrackWatcher
+
+PLAYING = {"Player State": "Playing", "Artist": "Dark Tranquillity", "Name": "Moment", "Album": "Projector"}
+
+
+class Reads:
+    """read_state stand-in: returns `state` and records when it was asked (one Apple Events read each)."""
+
+    def __init__(self, state):
+        self.state = state
+        self.times = []
+
+    def __call__(self):
+        self.times.append(time.monotonic())
+        return self.state
+
+
+@pytest.fixture
+def watched():
+    """(watcher, source, reads, changes, changed event) of a notification-driven watcher, stopped afterwards."""
+    source = FakeNotificationSource()
+    reads = Reads(TrackState("stopped"))
+    changes = []
+    changed = threading.Event()
+
+    def on_change(state):
+        changes.append(state)
+        changed.set()
+
+    watcher = TrackWatcher(reads, on_change, source=source, poll_interval=0.01).start()
+    assert changed.wait(2)  # initial read
+    yield watcher, source, reads, changes, changed
+    watcher.stop()
+
+
+def test_notification_push(benchmark, watched):
+    """post() to on_change, answered from the notification alone (no read_state call)."""
+    watcher, source, reads, changes, changed = watched
+    assert watcher.notifications
+    tracks = iter(range(10 ** 9))
+
+    def push():
+        changed.clear()
+        source.post(dict(PLAYING, Name=f"Moment {next(tracks)}"))
+        assert changed.wait(2)
+
+    benchmark(push)
+    assert changes[-1].state == "playing" and changes[-1].track[0] == "Dark Tranquillity"
+    assert len(reads.times) == 1
+
+
+def test_pause_does_not_push(watched):
+    """Pausing the same track updates the state but is not a track change."""
+    watcher, source, reads, changes, changed = watched
+    changed.clear()
+    source.post(PLAYING)
+    assert changed.wait(2)
+    count = len(changes)
+    source.post(dict(PLAYING, **{"Player State": "Paused"}))
+    time.sleep(0.1)
+    assert len(changes) == count
+    assert watcher.current.state == "paused"
+
+
+def test_polling_backs_off_while_paused():
+    """Without a notification source the watcher polls, doubling the interval up to max_interval."""
+    reads = Reads(TrackState("paused", ("Dark Tranquillity", "Moment", "Projector")))
+    watcher = TrackWatcher(reads, lambda state: None, source=FakeNotificationSource(available=False),
+                           poll_interval=0.02, max_interval=0.16).start()
+    try:
+        time.sleep(1.0)
+    finally:
+        watcher.stop()
+    assert not watcher.notifications
+    gaps = [b - a for a, b in zip(reads.times, reads.times[1:])]
+    # 0.02, 0.04, 0.08, then 0.16 each: ~9 reads in a second instead of 50 at a fixed interval
+    assert 5 <= len(reads.times) <= 15, gaps
+    assert gaps[0] < 0.08 and min(gaps[-3:]) >= 0.12, gaps
+
+    watcher.current = TrackState("playing", ("Dark Tranquillity", "Moment", "Projector"))
+    assert watcher.next_interval(0.16, changed=False) == 0.02
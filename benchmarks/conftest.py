@@ -0,0 +1,128 @@
+"""
+Benchmarks of the fetch, parse and tag I/O hot paths (pytest-benchmark). Fully offline:
+pages come from benchmarks/fixtures (see make_fixtures.py), the audio corpus is generated
+once per session and the app's caches and scan manifest live in a temporary data dir.
+
+    pip install pytest pytest-benchmark
+    python -m pytest benchmarks                              # run
+    python -m pytest benchmarks --benchmark-autosave         # run and keep the results in .benchmarks/
+    python -m pytest benchmarks --benchmark-compare --benchmark-compare-fail=mean:15%
+                                                             # fail on a >15% slowdown vs the last saved run
+    pytest-benchmark compare --group-by=name                 # saved runs side by side
+
+BENCH_CORPUS_FILES sets the corpus size (default 200 MP3/M4A/FLAC files, 512 KB artwork each).
+"""
+
+import os
+import shutil
+import sys
+import tempfile
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+FIXTURES = os.path.join(HERE, "fixtures")
+sys.path.insert(0, os.path.dirname(HERE))
+
+# Before any app module is imported: app_paths reads it once
+DATA_DIR = tempfile.mkdtemp(prefix="azathoth-bench-")
+os.environ["AZATHOTH_DATA_DIR"] = DATA_DIR
+
+import pytest
+
+from app_paths import env_int
+
+DEFAULT_CORPUS_FILES = 200
+
+
+def pytest_sessionfinish(session, exitstatus):
+    shutil.rmtree(DATA_DIR, ignore_errors=True)
+
+
+@pytest.fixture(scope="session")
+def lf():
+    """The app module; needs the app's dependencies (pywebview, appscript, ...) installed."""
+    try:
+        import lyrics_fetcher
+    except (ImportError, SystemExit) as e:
+        pytest.skip(f"lyrics_fetcher cannot be imported here ({e!r})")
+    return lyrics_fetcher
+
+
+@pytest.fixture(scope="session")
+def fixture_text():
+    def read(name):
+        with open(os.path.join(FIXTURES, name), encoding="utf-8") as f:
+            return f.read()
+    return read
+
+
+@pytest.fixture(scope="session")
+def corpus(tmp_path_factory):
+    """(directory, [(path, has_lyrics)]) of a synthetic library, shared by the read-only benchmarks."""
+    from fixtures.corpus import make_corpus
+    directory = str(tmp_path_factory.mktemp("corpus"))
+    return directory, make_corpus(directory, env_int("BENCH_CORPUS_FILES", DEFAULT_CORPUS_FILES))
+
+
+class FakeResponse:
+    def __init__(self, text, status_code=200):
+        self.text = text
+        self.status_code = status_code
+
+    def json(self):
+        import json
+        return json.loads(self.text)
+
+
+class FakeScraper:
+    """Stands in for the cloudscraper session: serves recorded pages by URL."""
+
+    def __init__(self, pages):
+        self.pages = pages
+
+    def get(self, url, **kwargs):
+        for fragment, text in self.pages.items():
+            if fragment in url:
+                return FakeResponse(text)
+        return FakeResponse("", 404)
+
+    post = get
+
+
+@pytest.fixture
+def offline_http(lf, fixture_text, monkeypatch):
+    """Routes the app's HTTP (requests session, cloudscraper, lyricsgenius) to the recorded pages."""
+    pages = {
+        "api.genius.com/search": fixture_text("genius_search.json"),
+        "genius.com/": fixture_text("genius_song.html"),
+        "lite.duckduckgo.com": fixture_text("ddg_lite.html"),
+        "darklyrics.com/lyrics/": fixture_text("darklyrics_album.html"),
+    }
+    scraper = FakeScraper(pages)
+
+    class NoGeniusClient:
+        def search_song(self, title, artist):
+            raise RuntimeError("lyricsgenius disabled offline")
+
+    monkeypatch.setattr(lf.HTTP, "get", scraper.get)
+    monkeypatch.setattr(lf.HTTP, "post", scraper.post)
+    monkeypatch.setattr(lf.HTTP, "scraper", lambda: scraper)
+    # The Genius fetcher falls back to the search API + page scrape when the client fails
+    monkeypatch.setattr(lf.HTTP, "genius_client", lambda token: NoGeniusClient())
+    return scraper
+
+
+@pytest.fixture
+def pipeline(lf, offline_http, monkeypatch):
+    """
+    The app's lookup path (AsyncLyricsPipeline + built-in providers, lyrics cache included)
+    over the recorded pages. httpx is kept out, so providers use their sync fetchers.
+    """
+    import async_providers
+    from providers import ProviderRegistry, ProviderStats
+    monkeypatch.setattr(async_providers, "_load_httpx", lambda: None)
+    registry = ProviderRegistry(stats=ProviderStats(persist=False))
+    registry.register(async_providers.GeniusProvider(lf.LyricsFetcher, lambda: "token"))
+    registry.register(async_providers.DarkLyricsProvider(lf.LyricsFetcher))
+    pipeline = async_providers.AsyncLyricsPipeline(registry)
+    yield pipeline
+    pipeline.close()
@@ -0,0 +1,84 @@
+"""
+Synthetic audio library for the tag I/O benchmarks: minimal MP3 / M4A / FLAC
+files whose tags look like a real library's (title, 512 KB cover art, lyrics
+on half of them). Every other FLAC starts with a padded ID3v2 tag, as some
+rippers write. Generated per session, never committed.
+"""
+
+import os
+import struct
+
+ATOM = struct.Struct(">I4s")
+# Zero padding after the leading ID3 tag of a FLAC file
+ID3_PADDING = 1024
+
+
+def _id3_prefix(title):
+    """A v2.3 tag with one TIT2 frame and padding, as found in front of some FLAC files."""
+    text = b'\0' + title.encode('latin-1')
+    frame = b'TIT2' + struct.pack(">IH", len(text), 0) + text
+    size = len(frame) + ID3_PADDING
+    syncsafe = bytes((size >> shift) & 0x7F for shift in (21, 14, 7, 0))
+    return b'ID3\x03\0\0' + syncsafe + frame + b'\0' * ID3_PADDING
+
+
+def make_corpus(directory, count, art_size=512 * 1024):
+    """Writes `count` synthetic MP3 / M4A / FLAC files (half with lyrics, all with artwork); returns [(path, has_lyrics)]."""
+    from mutagen.flac import FLAC, Picture
+    from mutagen.id3 import APIC, ID3, TIT2, USLT
+    from mutagen.mp4 import MP4, MP4Cover
+
+    artwork = os.urandom(art_size)
+    # 128 kbps / 44.1 kHz MPEG-1 Layer III frames of silence
+    mp3_audio = (b'\xff\xfb\x90\x64' + b'\0' * 413) * 40
+    mvhd = b'\0' * 4 + struct.pack(">IIII", 0, 0, 1000, 1000) + b'\0' * 80
+    m4a_audio = (ATOM.pack(28, b'ftyp') + b'M4A \0\0\0\0M4A mp42isom'
+                 + ATOM.pack(8 + len(mvhd) + 8, b'moov') + ATOM.pack(8 + len(mvhd), b'mvhd') + mvhd
+                 + ATOM.pack(8 + 16000, b'mdat') + b'\0' * 16000)
+    streaminfo = struct.pack(">HH", 4096, 4096) + b'\0' * 6 + bytes([0x0A, 0xC4, 0x42, 0xF0]) + b'\0' * 4 + b'\0' * 16
+    flac_audio = b'fLaC' + bytes([0x80]) + len(streaminfo).to_bytes(3, 'big') + streaminfo
+
+    lyrics = "First line of the song\nSecond line\n" * 20
+    paths = []
+    for i in range(count):
+        kind = ('mp3', 'm4a', 'flac', 'id3.flac')[i % 4]
+        with_lyrics = (i // 4) % 2 == 0
+        path = os.path.join(directory, f"track{i:04d}.{kind}")
+        if kind == 'mp3':
+            with open(path, 'wb') as f:
+                f.write(mp3_audio)
+            tags = ID3()
+            tags.add(TIT2(encoding=3, text=f"Track {i}"))
+            tags.add(APIC(encoding=3, mime='image/jpeg', type=3, desc='Cover', data=artwork))
+            if with_lyrics:
+                tags.add(USLT(encoding=3, lang='eng', desc='', text=lyrics))
+            tags.save(path)
+        elif kind == 'm4a':
+            with open(path, 'wb') as f:
+                f.write(m4a_audio)
+            audio = MP4(path)
+            audio['\xa9nam'] = [f"Track {i}"]
+            audio['covr'] = [MP4Cover(artwork)]
+            if with_lyrics:
+                audio['\xa9lyr'] = [lyrics]
+            audio.save()
+        else:
+            with open(path, 'wb') as f:
+                f.write(flac_audio)
+            audio = FLAC(path)
+            picture = Picture()
+            picture.type = 3
+            picture.mime = 'image/jpeg'
+            picture.data = artwork
+            audio.add_picture(picture)
+            audio['title'] = f"Track {i}"
+            if with_lyrics:
+                audio['lyrics'] = lyrics
+            audio.save()
+            if kind == 'id3.flac':
+                with open(path, 'rb') as f:
+                    data = f.read()
+                with open(path, 'wb') as f:
+                    f.write(_id3_prefix(f"Track {i}") + data)
+        paths.append((path, with_lyrics))
+    return paths
@@ -0,0 +1,207 @@
+"""
+Regenerates the offline page fixtures of the benchmark suite.
+
+The files follow the markup, nesting and size of the pages the fetchers
+parse on the live sites, with generated placeholder words in place of the
+copyrighted lyrics and site text:
+
+  genius_search.json     api.genius.com/search response, 10 song hits
+  genius_song.html       Genius song page: header, preloaded-state script, Lyrics__Container divs
+  darklyrics_album.html  DarkLyrics album page: 12 songs in div.lyrics
+  ddg_lite.html          DuckDuckGo Lite results page with 20 result links
+  titles.txt             Track titles with the usual metadata noise, one per line
+
+Output is deterministic: python benchmarks/fixtures/make_fixtures.py
+"""
+
+import json
+import os
+import random
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+ARTIST = "Dark Tranquillity"
+ALBUM = "Projector"
+SONGS = ["FreeCard", "ThereIn", "Auctioned", "To a Bitter Halt", "The Sun Fired Blanks", "Nether Novas",
+         "Day to End", "Dobermann", "On Your Time", "Exposure", "Undo Control", "Moment"]
+TARGET = SONGS[11]
+
+rng = random.Random(2024)
+WORDS = ("ash light veil silent burning glass shadow dream cold north tide frozen hollow "
+         "crown ember wake drift stone river sorrow night mirror pale flame echo wound").split()
+
+
+def line():
+    return " ".join(rng.choice(WORDS) for _ in range(rng.randint(4, 9))).capitalize()
+
+
+def stanza(lines):
+    return [line() for _ in range(lines)]
+
+
+def song_lines():
+    parts = []
+    for _ in range(rng.randint(5, 7)):
+        parts.append(stanza(rng.randint(4, 6)))
+    return parts
+
+
+def genius_search():
+    hits = []
+    for i, title in enumerate([TARGET] + SONGS[:9]):
+        slug = f"{ARTIST}-{title}".lower().replace(" ", "-")
+        hits.append({
+            "highlights": [],
+            "index": "song",
+            "type": "song",
+            "result": {
+                "annotation_count": rng.randint(0, 12),
+                "api_path": f"/songs/{100000 + i}",
+                "artist_names": ARTIST,
+                "full_title": f"{title} by {ARTIST}",
+                "header_image_thumbnail_url": f"https://images.genius.com/{rng.getrandbits(64):016x}.300x300x1.jpg",
+                "header_image_url": f"https://images.genius.com/{rng.getrandbits(64):016x}.1000x1000x1.jpg",
+                "id": 100000 + i,
+                "lyrics_owner_id": rng.randint(1, 10 ** 7),
+                "lyrics_state": "complete",
+                "path": f"/{slug}-lyrics",
+                "primary_artist_names": ARTIST,
+                "pyongs_count": None,
+                "relationships_index_url": f"https://genius.com/{slug}-sample",
+                "release_date_components": {"year": 1999, "month": 6, "day": 21},
+                "release_date_for_display": "June 21, 1999",
+                "song_art_image_thumbnail_url": f"https://images.genius.com/{rng.getrandbits(64):016x}.300x300x1.jpg",
+                "song_art_image_url": f"https://images.genius.com/{rng.getrandbits(64):016x}.1000x1000x1.jpg",
+                "stats": {"unreviewed_annotations": 0, "hot": False, "pageviews": rng.randint(1000, 90000)},
+                "title": title,
+                "title_with_featured": title,
+                "url": f"https://genius.com/{slug}-lyrics",
+                "featured_artists": [],
+                "primary_artist": {
+                    "api_path": "/artists/21843",
+                    "header_image_url": f"https://images.genius.com/{rng.getrandbits(64):016x}.1000x333x1.jpg",
+                    "id": 21843,
+                    "image_url": f"https://images.genius.com/{rng.getrandbits(64):016x}.1000x1000x1.jpg",
+                    "is_meme_verified": False,
+                    "is_verified": False,
+                    "name": ARTIST,
+                    "url": "https://genius.com/artists/Dark-tranquillity",
+                },
+            },
+        })
+    return {"meta": {"status": 200}, "response": {"hits": hits}}
+
+
+def genius_song():
+    head = ['<!doctype html><html><head><meta charset="utf-8"/>',
+            f'<title>{ARTIST} – {TARGET} Lyrics | Genius Lyrics</title>']
+    for i in range(40):
+        head.append(f'<meta property="og:tag{i}" content="{line()}"/>')
+    for i in range(12):
+        head.append(f'<link rel="stylesheet" href="https://assets.genius.com/{rng.getrandbits(48):012x}.css"/>')
+    head.append('</head><body>')
+
+    nav = ['<div class="Header__Container-sc-1"><nav class="Navigation__Wrapper">']
+    for i in range(60):
+        nav.append(f'<a class="NavLink__Link-sc-{i}" href="/tags/{rng.choice(WORDS)}">{line()}</a>')
+    nav.append('</nav></div>')
+
+    # Genius inlines the page state as a JSON string of a few hundred KB
+    state = {"songPage": {"trackingData": [{"key": rng.choice(WORDS), "value": line()} for _ in range(2000)],
+                          "annotations": [{"id": i, "body": " ".join(stanza(3))} for i in range(1500)]}}
+    script = ("<script>window.__PRELOADED_STATE__ = JSON.parse('"
+              + json.dumps(json.dumps(state))[1:-1].replace("'", "\\'") + "');</script>")
+
+    body = [f'<main><div class="SongHeader__Title"><h1>{TARGET}</h1><a href="/artists/x">{ARTIST}</a></div>',
+            '<div id="lyrics-root" class="Lyrics__Root-sc-1ynbvzw-0">',
+            f'<div class="LyricsHeader__Container"><h2>{TARGET} Lyrics</h2></div>']
+    parts = song_lines()
+    # The lyrics are split over several containers, interleaved with ad slots
+    for i in range(0, len(parts), 2):
+        chunk = parts[i:i + 2]
+        inner = "<br/><br/>".join(
+            f'[Verse {i + j + 1}]<br/>' + "<br/>".join(
+                f'<a href="/{rng.getrandbits(32)}" class="ReferentFragmentdesktop__ClickTarget">'
+                f'<span class="ReferentFragmentdesktop__Highlight">{text}</span></a>' if rng.random() < 0.3 else text
+                for text in lines)
+            for j, lines in enumerate(chunk))
+        body.append(f'<div data-lyrics-container="true" class="Lyrics__Container-sc-1ynbvzw-1 kUgSbL">{inner}</div>')
+        body.append(f'<div class="RightSidebar__Container"><div id="ad-{i}" class="DfpAd__Container"></div></div>')
+    body.append('</div>')
+    for i in range(30):
+        body.append(f'<div class="SongDescription__Content"><p>{" ".join(stanza(4))}</p></div>')
+    body.append('</main>')
+
+    footer = ['<footer class="PageFooterdesktop__Container">']
+    for i in range(80):
+        footer.append(f'<a href="/verified-artists/{i}">{line()}</a>')
+    footer.append('</footer>')
+    return "\n".join(head + nav + [script] + body + footer + ['</body></html>'])
+
+
+def darklyrics_album():
+    out = ['<!DOCTYPE html><html><head><meta http-equiv="Content-Type" content="text/html; charset=utf-8" />',
+           f'<title>{ARTIST.upper()} LYRICS - "{ALBUM}" (1999) album</title>',
+           '<link rel="stylesheet" href="../../darklyrics.css" type="text/css" /></head><body>',
+           '<div class="cont"><div class="albumlyrics">',
+           f'<h2>album: <strong>"{ALBUM}"</strong> (1999)</h2>']
+    for i, title in enumerate(SONGS, 1):
+        out.append(f'<a href="#{i}">{i}. {title}</a><br />')
+    out.append('</div><div class="lyrics">')
+    for i, title in enumerate(SONGS, 1):
+        out.append(f'<h3><a name="{i}">{i}. {title}</a></h3><br />')
+        for lines in song_lines():
+            out.append("<br />\n".join(lines) + "<br />\n<br />")
+        out.append("")
+    out.append('<div class="thanks">Thanks to a reader for sending these lyrics.</div>')
+    out.append('<div class="note">Submits, comments, corrections are welcomed at darklyrics.com</div></div>')
+    out.append('<div class="footer">' + "".join(f'<a href="/{c}.html">{c.upper()}</a> ' for c in "abcdefghijklmnopqrstuvwxyz")
+               + '</div></div></body></html>')
+    return "\n".join(out)
+
+
+def ddg_lite():
+    out = ['<!DOCTYPE html PUBLIC "-//W3C//DTD HTML 4.01 Transitional//EN"><html><head>',
+           '<meta http-equiv="content-type" content="text/html; charset=UTF-8">',
+           f'<title>site:darklyrics.com "{ARTIST}" "{TARGET}" at DuckDuckGo</title></head><body>',
+           '<form action="/lite/" method="post"><input class="query" type="text" name="q"></form>',
+           '<table border="0">']
+    urls = [f"https://www.example-lyrics-{i}.com/{rng.choice(WORDS)}/{rng.getrandbits(32):x}.html" for i in range(19)]
+    # The DarkLyrics hit is rarely the first result
+    urls.insert(6, "https://www.darklyrics.com/lyrics/darktranquillity/projector.html#12")
+    for i, url in enumerate(urls, 1):
+        out.append(f'<tr><td valign="top">{i}.&nbsp;</td><td>'
+                   f'<a rel="nofollow" href="{url}" class=\'result-link\'>{line()}</a></td></tr>')
+        out.append(f'<tr><td>&nbsp;&nbsp;&nbsp;</td><td class=\'result-snippet\'>{" ".join(stanza(3))}</td></tr>')
+        out.append(f'<tr><td>&nbsp;&nbsp;&nbsp;</td><td><span class=\'link-text\'>{url[8:60]}</span></td></tr>')
+        out.append('<tr><td>&nbsp;</td><td>&nbsp;</td></tr>')
+    out.append('</table></body></html>')
+    return "\n".join(out)
+
+
+def titles():
+    noise = ["", "", "", " (Remastered 2009)", " [Live]", " (Live at Wacken)", " - 2011 Remaster",
+             " (feat. Anders Fridén)", " [feat. Guest]", " - Remix", " (Demo)", " (Album Version)",
+             " - Remastered", " (ft. Someone)", " (Bonus Track)"]
+    out = []
+    for _ in range(1000):
+        base = " ".join(rng.choice(WORDS).capitalize() for _ in range(rng.randint(1, 5)))
+        out.append(base + rng.choice(noise))
+    return "\n".join(out) + "\n"
+
+
+def main():
+    files = {
+        "genius_search.json": json.dumps(genius_search(), indent=1),
+        "genius_song.html": genius_song(),
+        "darklyrics_album.html": darklyrics_album(),
+        "ddg_lite.html": ddg_lite(),
+        "titles.txt": titles(),
+    }
+    for name, text in files.items():
+        with open(os.path.join(HERE, name), "w", encoding="utf-8") as f:
+            f.write(text)
+        print(f"  {name} ({len(text.encode('utf-8')) / 1024:.0f} KB)")
+
+
+if __name__ == "__main__":
+    main()
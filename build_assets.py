@@ -0,0 +1,124 @@
+"""
+Builds the web UI assets bundled with the app into web/dist/:
+
+  app.css                    Tailwind CSS precompiled from the classes used in lyrics_fetcher.py
+  fonts.css + fonts/*.woff2  Space Grotesk and Material Symbols Outlined
+  confetti.browser.min.js    canvas-confetti
+  app_icon.png               About-box icon (from process_icon.py)
+
+Run before `pyinstaller` (and after changing the UI markup):
+
+    python build_assets.py            # everything
+    python build_assets.py --css      # only recompile app.css
+
+Needs Node.js (npm) for Tailwind and network access for the fonts / scripts;
+the app itself then loads nothing from the network.
+"""
+
+import hashlib
+import json
+import os
+import re
+import shutil
+import subprocess
+import sys
+import urllib.request
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+WEB_DIR = os.path.join(HERE, "web")
+DIST_DIR = os.path.join(WEB_DIR, "dist")
+
+FONT_CSS_URLS = [
+    "https://fonts.googleapis.com/css2?family=Space+Grotesk:wght@300;400;500;600;700&display=swap",
+    "https://fonts.googleapis.com/css2?family=Material+Symbols+Outlined:wght,FILL@100..700,0..1&display=swap",
+]
+SCRIPTS = {
+    "confetti.browser.min.js": "https://cdn.jsdelivr.net/npm/canvas-confetti@1.9.2/dist/confetti.browser.min.js",
+}
+# Google Fonts serves woff2 only to browsers it recognises
+USER_AGENT = ("Mozilla/5.0 (Macintosh; Intel Mac OS X 14_0) AppleWebKit/605.1.15 "
+              "(KHTML, like Gecko) Version/17.0 Safari/605.1.15")
+
+
+def fetch(url):
+    request = urllib.request.Request(url, headers={"User-Agent": USER_AGENT})
+    with urllib.request.urlopen(request, timeout=30) as response:
+        return response.read()
+
+
+def write(name, data):
+    path = os.path.join(DIST_DIR, name)
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, "wb") as f:
+        f.write(data)
+    print(f"  {name} ({len(data) / 1024:.0f} KB)")
+
+
+def build_css():
+    """Compiles app.css with the pinned Tailwind CLI from web/package.json."""
+    if not os.path.isdir(os.path.join(WEB_DIR, "node_modules")):
+        subprocess.check_call(["npm", "install", "--no-audit", "--no-fund"], cwd=WEB_DIR)
+    os.makedirs(DIST_DIR, exist_ok=True)
+    subprocess.check_call(["npx", "tailwindcss", "-c", "tailwind.config.js", "-i", "input.css",
+                           "-o", os.path.join("dist", "app.css"), "--minify"], cwd=WEB_DIR)
+    print(f"  app.css ({os.path.getsize(os.path.join(DIST_DIR, 'app.css')) / 1024:.0f} KB)")
+
+
+def build_fonts():
+    """Downloads the font files and rewrites the Google Fonts CSS to point at them."""
+    css_parts = []
+    for css_url in FONT_CSS_URLS:
+        css = fetch(css_url).decode("utf-8")
+
+        def localize(match):
+            url = match.group(1)
+            name = "fonts/" + hashlib.sha1(url.encode()).hexdigest()[:12] + ".woff2"
+            if not os.path.exists(os.path.join(DIST_DIR, name)):
+                write(name, fetch(url))
+            return f"url({name})"
+
+        css_parts.append(re.sub(r"url\((https://[^)]+)\)", localize, css))
+    write("fonts.css", "\n".join(css_parts).encode("utf-8"))
+
+
+def build_scripts():
+    for name, url in SCRIPTS.items():
+        write(name, fetch(url))
+
+
+def build_images():
+    """Copies the About icon next to the CSS, so the page loads it through its base URI."""
+    os.makedirs(DIST_DIR, exist_ok=True)
+    shutil.copyfile(os.path.join(HERE, "app_icon.png"), os.path.join(DIST_DIR, "app_icon.png"))
+    print(f"  app_icon.png ({os.path.getsize(os.path.join(DIST_DIR, 'app_icon.png')) / 1024:.0f} KB)")
+
+
+def write_manifest():
+    """Records file sizes and hashes, so a release can be checked against its build."""
+    manifest = {}
+    for root, _, files in os.walk(DIST_DIR):
+        for f in sorted(files):
+            if f == "manifest.json":
+                continue
+            path = os.path.join(root, f)
+            with open(path, "rb") as fh:
+                data = fh.read()
+            manifest[os.path.relpath(path, DIST_DIR)] = {"bytes": len(data), "sha256": hashlib.sha256(data).hexdigest()}
+    with open(os.path.join(DIST_DIR, "manifest.json"), "w") as f:
+        json.dump(manifest, f, indent=2, sort_keys=True)
+
+
+def main(args):
+    print(f"Building web assets into {DIST_DIR}")
+    build_css()
+    build_images()
+    if "--css" not in args:
+        build_fonts()
+        build_scripts()
+    write_manifest()
+    print("Done.")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))
@@ -0,0 +1,350 @@
+"""
+Watch mode for local music folders: new or changed audio files get their
+lyrics fetched and written without rescanning the tree.
+
+Event sources share one interface, start(callback) -> bool and stop(), where
+callback receives a list of changed file paths:
+  InotifySource   - Linux inotify via ctypes (recursive, follows new subfolders)
+  FSEventsSource  - macOS FSEvents via PyObjC
+  FakeFolderSource - emits paths in-process, for tests
+"""
+
+import ctypes
+import ctypes.util
+import os
+import select
+import struct
+import sys
+import threading
+import time
+
+import library_scanner
+from app_paths import env_float
+from batch_engine import BatchFetchEngine
+from tag_probe import probe_lyrics
+
+# Seconds a path must stay quiet before it is read (.env: WATCH_DEBOUNCE);
+# copies and rips write a file in many chunks
+DEFAULT_DEBOUNCE = 2.0
+
+
+def _is_audio(path):
+    return os.path.splitext(path)[1].lower() in library_scanner.SUPPORTED_EXTS
+
+
+class InotifySource:
+    """Recursive inotify watch (Linux). Reports files when they are closed after writing or moved in."""
+    IN_CLOSE_WRITE = 0x00000008
+    IN_MOVED_TO = 0x00000080
+    IN_CREATE = 0x00000100
+    IN_Q_OVERFLOW = 0x00004000
+    IN_IGNORED = 0x00008000
+    IN_ISDIR = 0x40000000
+    EVENT = struct.Struct("iIII")
+
+    def __init__(self, root):
+        self.root = root
+        self._fd = None
+        self._dirs = {}  # watch descriptor -> directory
+        self._stop = threading.Event()
+        self._thread = None
+
+    def _add_tree(self, directory):
+        """Watches directory and its subfolders; returns audio files already inside (moved-in folders)."""
+        mask = self.IN_CLOSE_WRITE | self.IN_MOVED_TO | self.IN_CREATE
+        found = []
+        for root, dirs, files in os.walk(directory):
+            wd = self._libc.inotify_add_watch(self._fd, os.fsencode(root), mask)
+            if wd < 0:
+                print(f"DEBUG: inotify_add_watch failed for {root} (errno {ctypes.get_errno()})")
+            else:
+                self._dirs[wd] = root
+            found.extend(os.path.join(root, f) for f in files if _is_audio(f))
+        return found
+
+    def start(self, callback):
+        if not sys.platform.startswith("linux"):
+            return False
+        try:
+            self._libc = ctypes.CDLL(ctypes.util.find_library("c") or "libc.so.6", use_errno=True)
+            self._fd = self._libc.inotify_init1(os.O_NONBLOCK | os.O_CLOEXEC)
+            if self._fd < 0:
+                return False
+        except Exception as e:
+            print(f"DEBUG: inotify unavailable: {e}")
+            return False
+        # Only places the watches: files already in the tree are left alone
+        self._add_tree(self.root)
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, args=(callback,), name="inotify", daemon=True)
+        self._thread.start()
+        return True
+
+    def _run(self, callback):
+        while not self._stop.is_set():
+            ready, _, _ = select.select([self._fd], [], [], 0.5)
+            if not ready:
+                continue
+            try:
+                data = os.read(self._fd, 64 * 1024)
+            except BlockingIOError:
+                continue
+            except OSError:
+                break
+            paths = []
+            offset = 0
+            while offset + self.EVENT.size <= len(data):
+                wd, mask, _, length = self.EVENT.unpack_from(data, offset)
+                name = data[offset + self.EVENT.size:offset + self.EVENT.size + length].rstrip(b"\0")
+                offset += self.EVENT.size + length
+                if mask & self.IN_Q_OVERFLOW:
+                    print("DEBUG: inotify queue overflow, some new files may be missed")
+                    continue
+                if mask & self.IN_IGNORED:
+                    self._dirs.pop(wd, None)
+                    continue
+                directory = self._dirs.get(wd)
+                if directory is None or not name:
+                    continue
+                path = os.path.join(directory, os.fsdecode(name))
+                if mask & self.IN_ISDIR:
+                    if mask & (self.IN_CREATE | self.IN_MOVED_TO):
+                        paths.extend(self._add_tree(path))
+                elif mask & (self.IN_CLOSE_WRITE | self.IN_MOVED_TO) and _is_audio(path):
+                    paths.append(path)
+            if paths:
+                callback(paths)
+
+    def stop(self):
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(2)
+            self._thread = None
+        if self._fd is not None:
+            try:
+                os.close(self._fd)
+            except OSError:
+                pass
+            self._fd = None
+
+
+class FSEventsSource:
+    """FSEvents stream (macOS, PyObjC) with per-file events, run on its own CFRunLoop thread."""
+
+    def __init__(self, root, latency=0.5):
+        self.root = root
+        self.latency = latency
+        self._stream = None
+        self._loop = None
+        self._thread = None
+
+    def start(self, callback):
+        try:
+            import FSEvents
+            import CoreFoundation
+        except ImportError:
+            return False
+
+        def _on_events(stream, info, count, event_paths, event_flags, event_ids):
+            paths = []
+            for path, flags in zip(event_paths, event_flags):
+                path = str(path)
+                if flags & FSEvents.kFSEventStreamEventFlagItemIsDir:
+                    # A folder created or moved in: pick up the files it brought along
+                    if flags & (FSEvents.kFSEventStreamEventFlagItemCreated | FSEvents.kFSEventStreamEventFlagItemRenamed) \
+                            and os.path.isdir(path):
+                        paths.extend(library_scanner.iter_audio_files(path))
+                elif _is_audio(path) and os.path.isfile(path):
+                    paths.append(path)
+            if paths:
+                callback(paths)
+
+        flags = (FSEvents.kFSEventStreamCreateFlagFileEvents | FSEvents.kFSEventStreamCreateFlagUseCFTypes
+                 | FSEvents.kFSEventStreamCreateFlagNoDefer)
+        self._stream = FSEvents.FSEventStreamCreate(
+            None, _on_events, None, [self.root], FSEvents.kFSEventStreamEventIdSinceNow, self.latency, flags)
+        if self._stream is None:
+            return False
+        started = threading.Event()
+
+        def run():
+            self._loop = CoreFoundation.CFRunLoopGetCurrent()
+            FSEvents.FSEventStreamScheduleWithRunLoop(self._stream, self._loop, CoreFoundation.kCFRunLoopDefaultMode)
+            FSEvents.FSEventStreamStart(self._stream)
+            started.set()
+            CoreFoundation.CFRunLoopRun()
+
+        self._thread = threading.Thread(target=run, name="fsevents", daemon=True)
+        self._thread.start()
+        return started.wait(5)
+
+    def stop(self):
+        if self._stream is None:
+            return
+        try:
+            import FSEvents
+            import CoreFoundation
+            FSEvents.FSEventStreamStop(self._stream)
+            FSEvents.FSEventStreamInvalidate(self._stream)
+            if self._loop is not None:
+                CoreFoundation.CFRunLoopStop(self._loop)
+        except Exception:
+            pass
+        self._stream = None
+        self._loop = None
+
+
+class FakeFolderSource:
+    """In-process event source; call emit(paths) to simulate new files."""
+
+    def __init__(self, root=None):
+        self.root = root
+        self._callback = None
+
+    def start(self, callback):
+        self._callback = callback
+        return True
+
+    def stop(self):
+        self._callback = None
+
+    def emit(self, paths):
+        if self._callback is not None:
+            self._callback(list(paths))
+
+
+def default_source(root):
+    """The native event source for this platform."""
+    if sys.platform == "darwin":
+        return FSEventsSource(root)
+    return InotifySource(root)
+
+
+class FolderWatcher:
+    """
+    Fetches and writes lyrics for audio files that appear under `root`.
+
+    fetch(track) -> LyricsResult, where track is a library_scanner.read_track() dict;
+    write(path, lyrics) -> bool (e.g. DirectoryScanner.write_lyrics_to_file);
+    on_event({path, status, ...}) reports progress: queued, has_lyrics, written,
+    not_found, failed (called from worker threads).
+    """
+
+    def __init__(self, root, fetch, write, source=None, debounce=None, on_event=None, manifest=None):
+        self.root = os.path.abspath(root)
+        self.fetch = fetch
+        self.write = write
+        self.source = source if source is not None else default_source(self.root)
+        self.debounce = debounce if debounce is not None else env_float("WATCH_DEBOUNCE", DEFAULT_DEBOUNCE)
+        self.on_event = on_event
+        self.manifest = manifest if manifest is not None else library_scanner.SCAN_MANIFEST
+        self._pending = {}   # path -> time of the last event
+        self._written = {}   # path -> time we wrote lyrics to it (its own change events are ignored)
+        self._engines = []
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread = None
+
+    @property
+    def running(self):
+        return self._thread is not None and self._thread.is_alive()
+
+    def start(self):
+        """Returns False if no event source is available on this system."""
+        if not self.source.start(self._on_paths):
+            print(f"Folder watch unavailable for {self.root}")
+            return False
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, name="folder-watch", daemon=True)
+        self._thread.start()
+        print(f"Watching {self.root} for new music")
+        return True
+
+    def stop(self):
+        self._stop.set()
+        self.source.stop()
+        with self._lock:
+            engines, self._engines = self._engines, []
+        for engine in engines:
+            engine.cancel()
+
+    def _emit(self, path, status, **extra):
+        if self.on_event:
+            try:
+                self.on_event(dict(extra, path=path, status=status))
+            except Exception as e:
+                print(f"Folder watch on_event callback failed: {e}")
+
+    def _on_paths(self, paths):
+        now = time.monotonic()
+        with self._lock:
+            for path in paths:
+                if not _is_audio(path):
+                    continue
+                written = self._written.get(path)
+                if written is not None and now - written < self.debounce * 2 + 5:
+                    continue
+                self._pending[path] = now
+
+    def _take_ready(self):
+        """Paths whose last event is older than the debounce window."""
+        now = time.monotonic()
+        with self._lock:
+            ready = [p for p, t in self._pending.items() if now - t >= self.debounce]
+            for path in ready:
+                del self._pending[path]
+            self._written = {p: t for p, t in self._written.items() if now - t < self.debounce * 2 + 5}
+        return ready
+
+    def _run(self):
+        tick = max(0.05, min(0.5, self.debounce / 2))
+        while not self._stop.wait(tick):
+            ready = [p for p in self._take_ready() if os.path.isfile(p)]
+            if ready:
+                try:
+                    self.process(ready)
+                except Exception as e:
+                    print(f"Folder watch failed to process {len(ready)} files: {e}")
+
+    def process(self, paths):
+        """Reads tags of just these files and queues the ones without lyrics for fetching."""
+        missing = []
+        unknown = []
+        for path in paths:
+            # Files that already carry lyrics are settled from their tag headers, no full parse
+            if probe_lyrics(path):
+                self._emit(path, "has_lyrics")
+            else:
+                unknown.append(path)
+        for track in library_scanner.scan(None, paths=unknown, manifest=self.manifest):
+            if track['has_lyrics']:
+                self._emit(track['path'], "has_lyrics")
+            else:
+                missing.append(track)
+                self._emit(track['path'], "queued", artist=track['artist'], title=track['title'])
+        if not missing:
+            return None
+
+        def on_progress(res):
+            path = res.item['path']
+            result = res.result
+            if result is None or not result.found:
+                status = "failed" if res.error or (result and result.error) else "not_found"
+                self._emit(path, status)
+                return
+            with self._lock:
+                self._written[path] = time.monotonic()
+            if self.write(path, result.text):
+                self._emit(path, "written", source=result.source)
+            else:
+                self._emit(path, "failed")
+
+        def on_done(summary):
+            with self._lock:
+                if engine in self._engines:
+                    self._engines.remove(engine)
+
+        engine = BatchFetchEngine(self.fetch, on_progress=on_progress, on_done=on_done)
+        with self._lock:
+            self._engines.append(engine)
+        return engine.start(missing)
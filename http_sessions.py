@@ -0,0 +1,216 @@
+"""
+Process-wide pooled HTTP sessions shared by all lyrics providers.
+requests, cloudscraper and lyricsgenius are imported on first use, not at app start.
+"""
+
+import threading
+import time
+from contextlib import contextmanager
+from urllib.parse import urlsplit
+
+from app_paths import env_float, env_int
+
+# Defaults (overridable via .env: HTTP_POOL_SIZE, HTTP_TIMEOUT)
+DEFAULT_POOL_SIZE = 8
+DEFAULT_TIMEOUT = 15
+
+# Per-provider limits: host suffix -> (max concurrent requests, requests per second, burst)
+# DuckDuckGo Lite blocks aggressive clients quickly, DarkLyrics is a small site.
+HOST_LIMITS = {
+    "genius.com": (4, 5.0, 5),
+    "darklyrics.com": (2, 1.0, 2),
+    "duckduckgo.com": (1, 0.5, 1),
+}
+
+
+class TokenBucket:
+    """Classic token bucket: `rate` tokens/second, holding at most `capacity`."""
+
+    def __init__(self, rate, capacity=1):
+        self.rate = float(rate)
+        self.capacity = max(1, capacity)
+        self._tokens = float(self.capacity)
+        self._stamp = time.monotonic()
+        self._lock = threading.Lock()
+
+    def reserve(self):
+        """Takes a token if available, otherwise returns the seconds to wait."""
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self.capacity, self._tokens + (now - self._stamp) * self.rate)
+            self._stamp = now
+            if self._tokens >= 1:
+                self._tokens -= 1
+                return 0.0
+            return (1 - self._tokens) / self.rate
+
+    def acquire(self, cancel_event=None):
+        """Blocks until a token is available. Returns False if cancel_event got set meanwhile."""
+        while True:
+            wait = self.reserve()
+            if wait <= 0:
+                return True
+            if cancel_event is not None:
+                if cancel_event.wait(wait):
+                    return False
+            else:
+                time.sleep(wait)
+
+
+class HostThrottle:
+    """Concurrency cap plus token-bucket rate limit for every request to matching hosts."""
+
+    def __init__(self, limits=None):
+        self._limits = {}
+        for suffix, (concurrency, rate, burst) in (limits or {}).items():
+            self.configure(suffix, concurrency, rate, burst)
+
+    def configure(self, host_suffix, concurrency, rate, burst=1):
+        concurrency = max(1, concurrency)
+        self._limits[host_suffix] = (concurrency, threading.BoundedSemaphore(concurrency), TokenBucket(rate, burst))
+
+    def limit_for(self, url):
+        """Returns (host_suffix, concurrency, semaphore, bucket) for a url, or None if unlimited."""
+        host = urlsplit(url).hostname or ""
+        for suffix, (concurrency, semaphore, bucket) in self._limits.items():
+            if host == suffix or host.endswith("." + suffix):
+                return suffix, concurrency, semaphore, bucket
+        return None
+
+    @contextmanager
+    def slot(self, url):
+        """Holds a concurrency slot (after waiting for a rate token) for the duration of a request."""
+        limit = self.limit_for(url)
+        if limit is None:
+            yield
+            return
+        _, _, semaphore, bucket = limit
+        with semaphore:
+            bucket.acquire()
+            yield
+
+    def wrap(self, adapter):
+        """Makes every request sent through a transport adapter respect the host limits."""
+        send = adapter.send
+
+        def throttled_send(request, **kwargs):
+            with self.slot(request.url):
+                return send(request, **kwargs)
+
+        adapter.send = throttled_send
+        return adapter
+
+
+class SessionManager:
+    """
+    Hands out long-lived HTTP clients so lookups reuse TCP/TLS connections:
+    - one keep-alive requests.Session per host (own connection pool & cookies)
+    - one cloudscraper instance, so solved Cloudflare challenge cookies persist
+    - one lyricsgenius client per access token
+    All of them go through `throttle`, so concurrent batch fetches respect HOST_LIMITS.
+    """
+
+    def __init__(self, pool_size=None, timeout=None, limits=HOST_LIMITS):
+        self.throttle = HostThrottle(limits)
+        self._pool_size = pool_size
+        self._timeout = timeout
+        self._sessions = {}
+        self._scraper = None
+        self._genius_clients = {}
+        self._lock = threading.Lock()
+
+    # Settings are resolved on first use so values from .env (loaded after imports) apply
+    @property
+    def pool_size(self):
+        if self._pool_size is None:
+            self._pool_size = max(1, env_int("HTTP_POOL_SIZE", DEFAULT_POOL_SIZE))
+        return self._pool_size
+
+    @property
+    def timeout(self):
+        if self._timeout is None:
+            self._timeout = env_float("HTTP_TIMEOUT", DEFAULT_TIMEOUT)
+        return self._timeout
+
+    def _mount_pools(self, session, schemes=("http://", "https://")):
+        from requests.adapters import HTTPAdapter
+        for scheme in schemes:
+            session.mount(scheme, self.throttle.wrap(HTTPAdapter(pool_connections=4, pool_maxsize=self.pool_size)))
+
+    def session_for(self, url):
+        """Returns the shared keep-alive session for the url's host."""
+        host = urlsplit(url).netloc.lower()
+        with self._lock:
+            session = self._sessions.get(host)
+            if session is None:
+                import requests
+                session = requests.Session()
+                self._mount_pools(session)
+                self._sessions[host] = session
+            return session
+
+    def get(self, url, **kwargs):
+        kwargs.setdefault('timeout', self.timeout)
+        return self.session_for(url).get(url, **kwargs)
+
+    def post(self, url, **kwargs):
+        kwargs.setdefault('timeout', self.timeout)
+        return self.session_for(url).post(url, **kwargs)
+
+    def scraper(self):
+        """Returns the shared Cloudflare-capable client (falls back to a plain session)."""
+        with self._lock:
+            if self._scraper is None:
+                try:
+                    import cloudscraper
+                    scraper = cloudscraper.create_scraper(browser={'browser': 'chrome', 'platform': 'darwin', 'desktop': True})
+                    # Keep cloudscraper's TLS adapter for https, only widen its pool
+                    tls_adapter = scraper.get_adapter('https://')
+                    try:
+                        tls_adapter.init_poolmanager(4, self.pool_size)
+                    except Exception as e:
+                        print(f"Could not resize cloudscraper pool: {e}")
+                    self.throttle.wrap(tls_adapter)
+                    self._mount_pools(scraper, schemes=("http://",))
+                except Exception as e:
+                    print(f"Cloudscraper init failed: {e}")
+                    import requests
+                    scraper = requests.Session()
+                    self._mount_pools(scraper)
+                self._scraper = scraper
+            return self._scraper
+
+    def genius_client(self, token):
+        """Returns a reusable lyricsgenius client for token."""
+        with self._lock:
+            genius = self._genius_clients.get(token)
+            if genius is None:
+                import lyricsgenius
+                genius = lyricsgenius.Genius(token, verbose=False, timeout=self.timeout)
+                genius.remove_section_headers = True # 自動移除 [Chorus] 等標籤
+                session = getattr(genius, '_session', None)
+                if session is not None:
+                    self._mount_pools(session)
+                self._genius_clients[token] = genius
+            return genius
+
+    def close(self):
+        """Closes every pooled connection (e.g. on quit)."""
+        with self._lock:
+            clients = list(self._sessions.values())
+            if self._scraper is not None:
+                clients.append(self._scraper)
+            clients.extend(getattr(g, '_session', None) for g in self._genius_clients.values())
+            self._sessions.clear()
+            self._scraper = None
+            self._genius_clients.clear()
+        for client in clients:
+            try:
+                if client is not None:
+                    client.close()
+            except Exception:
+                pass
+
+
+# Process-wide session manager used by LyricsFetcher
+HTTP = SessionManager()
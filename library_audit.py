@@ -0,0 +1,78 @@
+"""Library-wide lyrics audit: finds every Music.app track without lyrics, chunk by chunk."""
+
+import threading
+import time
+
+from app_paths import env_int
+
+# Tracks read per bulk Apple Event round (.env: LIBRARY_AUDIT_CHUNK)
+DEFAULT_CHUNK_SIZE = 250
+
+
+class LibraryAudit:
+    """
+    Walks the library in chunks on a background thread and reports tracks missing lyrics.
+    Only the current chunk is held in memory; lyrics text is dropped right after the check.
+
+    Callbacks (invoked from the audit thread; marshal to the UI yourself):
+      on_progress({scanned, total, missing: [track dicts]}) - once per chunk
+      on_done({total, scanned, missing, cancelled, error, elapsed}) - once
+    """
+
+    def __init__(self, controller, chunk_size=None, on_progress=None, on_done=None):
+        self.controller = controller
+        self.chunk_size = chunk_size or max(1, env_int("LIBRARY_AUDIT_CHUNK", DEFAULT_CHUNK_SIZE))
+        self.on_progress = on_progress
+        self.on_done = on_done
+        self._cancel = threading.Event()
+        self._finished = threading.Event()
+        self._thread = None
+
+    @property
+    def running(self):
+        return self._thread is not None and not self._finished.is_set()
+
+    def start(self):
+        self._thread = threading.Thread(target=self._run, name="library-audit", daemon=True)
+        self._thread.start()
+        return self
+
+    def cancel(self):
+        self._cancel.set()
+
+    def wait(self, timeout=None):
+        return self._finished.wait(timeout)
+
+    def _run(self):
+        started = time.monotonic()
+        scanned = total = missing = 0
+        error = None
+        try:
+            for scanned, total, tracks in self.controller.iter_library_tracks(self.chunk_size):
+                if self._cancel.is_set():
+                    break
+                chunk_missing = [t for t in tracks if not t['lyrics'].strip()]
+                missing += len(chunk_missing)
+                if self.on_progress:
+                    try:
+                        self.on_progress({"scanned": scanned, "total": total, "missing": chunk_missing})
+                    except Exception as e:
+                        print(f"Audit on_progress callback failed: {e}")
+        except Exception as e:
+            print(f"Library audit failed: {e}")
+            error = str(e)
+        finally:
+            summary = {
+                "total": total,
+                "scanned": scanned,
+                "missing": missing,
+                "cancelled": self._cancel.is_set(),
+                "error": error,
+                "elapsed": time.monotonic() - started,
+            }
+            self._finished.set()
+            if self.on_done:
+                try:
+                    self.on_done(summary)
+                except Exception as e:
+                    print(f"Audit on_done callback failed: {e}")
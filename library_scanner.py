@@ -0,0 +1,360 @@
+"""
+Local music folder scanning.
+
+Each file is parsed once with mutagen: basic tags and lyrics presence come from
+the same raw tag object (no second easy=True open). Files are read on a thread
+pool by default, which suits NAS / network shares where the scan is I/O bound;
+executor="process" spreads parsing over CPU cores for fast local disks.
+Results are yielded as a stream in directory-walk order.
+
+With a ScanManifest, rescans only re-parse files whose size / mtime / inode
+changed since the last scan; everything else is served from the manifest.
+
+mutagen is imported on the first parse, so importing this module stays cheap.
+"""
+
+import os
+import sqlite3
+import threading
+import time
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+
+from app_paths import data_path, env_int
+from tag_probe import probe_lyrics
+
+SUPPORTED_EXTS = {'.mp3', '.m4a', '.flac', '.aac', '.alac', '.aiff'}
+
+# Default reader count (.env: SCAN_WORKERS)
+DEFAULT_WORKERS = 8
+
+# Raw tag keys per container
+ID3_KEYS = {'title': 'TIT2', 'artist': 'TPE1', 'album': 'TALB', 'genre': 'TCON'}
+MP4_KEYS = {'title': '\xa9nam', 'artist': '\xa9ART', 'album': '\xa9alb', 'genre': '\xa9gen'}
+VORBIS_LYRICS_KEYS = ('lyrics', 'unsyncedlyrics', 'unsynced lyrics')
+
+# Manifest rows written per transaction during a scan
+MANIFEST_FLUSH = 500
+TRACK_FIELDS = ('title', 'artist', 'album', 'genre', 'has_lyrics')
+
+
+def iter_audio_files(directory_path):
+    """Yields paths of supported audio files below directory_path."""
+    for root, dirs, files in os.walk(directory_path):
+        dirs.sort()
+        for f in sorted(files):
+            if os.path.splitext(f)[1].lower() in SUPPORTED_EXTS:
+                yield os.path.join(root, f)
+
+
+def _first(value):
+    """First text of a tag value (ID3 frame, MP4 list, Vorbis list) or ''."""
+    if value is None:
+        return ""
+    text = getattr(value, 'text', value)
+    if isinstance(text, (list, tuple)):
+        text = text[0] if text else ""
+    return str(text) if text is not None else ""
+
+
+def basic_tags(audio):
+    """Returns {title, artist, album, genre} from a non-easy mutagen file object ('' if missing)."""
+    from mutagen.id3 import ID3
+    from mutagen.mp4 import MP4Tags
+    tags = getattr(audio, 'tags', None)
+    result = {'title': "", 'artist': "", 'album': "", 'genre': ""}
+    if not tags:
+        return result
+    if isinstance(tags, ID3):  # MP3, AIFF
+        for field, frame in ID3_KEYS.items():
+            frames = tags.getall(frame)
+            result[field] = _first(frames[0]) if frames else ""
+    elif isinstance(tags, MP4Tags):
+        for field, key in MP4_KEYS.items():
+            result[field] = _first(tags.get(key))
+    else:  # Vorbis comments (FLAC / Ogg): keys are case-insensitive
+        for field in result:
+            result[field] = _first(tags.get(field))
+    return result
+
+
+def has_lyrics(audio):
+    """True if a non-easy mutagen file object carries non-empty lyrics."""
+    from mutagen.id3 import ID3
+    from mutagen.mp4 import MP4Tags
+    tags = getattr(audio, 'tags', None)
+    if not tags:
+        return False
+    if isinstance(tags, ID3):  # any USLT frame with text
+        return any(frame.text for frame in tags.getall('USLT'))
+    if isinstance(tags, MP4Tags):
+        return any(v.strip() for v in tags.get('\xa9lyr', []))
+    for key in VORBIS_LYRICS_KEYS:
+        try:
+            values = tags.get(key)
+        except Exception:
+            continue
+        if values and any(v.strip() for v in values):
+            return True
+    return False
+
+
+def check_lyrics(path):
+    """
+    True if the file carries non-empty lyrics. Answered from the tag headers
+    (tag_probe) when possible, with a full mutagen parse only as the fallback.
+    """
+    found = probe_lyrics(path)
+    if found is not None:
+        return found
+    import mutagen
+    try:
+        audio = mutagen.File(path)
+    except Exception as e:
+        print(f"Error reading {os.path.basename(path)}: {e}")
+        return False
+    return bool(audio) and has_lyrics(audio)
+
+
+def read_track(path):
+    """
+    Parses one file (a single mutagen open) into
+    {path, filename, title, artist, album, genre, has_lyrics}, or None if unreadable.
+    """
+    import mutagen
+    filename = os.path.basename(path)
+    try:
+        audio = mutagen.File(path)
+    except Exception as e:
+        print(f"Error scanning {filename}: {e}")
+        return None
+    tags = basic_tags(audio) if audio else {}
+    return {
+        'path': path,
+        'filename': filename,
+        'title': tags.get('title') or os.path.splitext(filename)[0],
+        'artist': tags.get('artist') or "Unknown",
+        'album': tags.get('album') or "Unknown",
+        'genre': tags.get('genre') or "",
+        'has_lyrics': bool(audio) and has_lyrics(audio),
+    }
+
+
+def file_signature(path):
+    """(size, mtime_ns, inode) of a file; any change means it must be parsed again."""
+    st = os.stat(path)
+    return st.st_size, st.st_mtime_ns, st.st_ino
+
+
+class ScanManifest:
+    """
+    Persistent record of scanned files: path, size, mtime, inode, extracted tags, has_lyrics.
+    Stored in scan_manifest.sqlite3 in the app data dir.
+    """
+
+    def __init__(self, path=None):
+        self.path = path
+        self._conn = None
+        self._disabled = False
+        self._lock = threading.Lock()
+
+    def _connect(self):
+        """Opens the database lazily. Returns None if the manifest is unusable."""
+        if self._conn is not None or self._disabled:
+            return self._conn
+        try:
+            if self.path is None:
+                self.path = data_path("scan_manifest.sqlite3")
+            conn = sqlite3.connect(self.path, check_same_thread=False, timeout=5)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.execute("""
+                CREATE TABLE IF NOT EXISTS files (
+                    path       TEXT PRIMARY KEY,
+                    size       INTEGER NOT NULL,
+                    mtime_ns   INTEGER NOT NULL,
+                    inode      INTEGER NOT NULL,
+                    title      TEXT,
+                    artist     TEXT,
+                    album      TEXT,
+                    genre      TEXT,
+                    has_lyrics INTEGER NOT NULL,
+                    scanned    REAL NOT NULL
+                )""")
+            conn.commit()
+            self._conn = conn
+        except Exception as e:
+            print(f"Scan manifest disabled ({self.path}): {e}")
+            self._disabled = True
+        return self._conn
+
+    @staticmethod
+    def _prefix_range(root):
+        prefix = os.path.join(root, "")
+        # Every path below root sorts in [prefix, prefix + U+10FFFF)
+        return prefix, prefix + "\U0010ffff"
+
+    def load(self, root):
+        """Returns {path: (signature, track dict)} for every file recorded below root."""
+        with self._lock:
+            conn = self._connect()
+            if conn is None:
+                return {}
+            try:
+                rows = conn.execute(
+                    "SELECT path, size, mtime_ns, inode, title, artist, album, genre, has_lyrics "
+                    "FROM files WHERE path >= ? AND path < ?", self._prefix_range(root)).fetchall()
+            except Exception as e:
+                print(f"Scan manifest read error: {e}")
+                return {}
+        entries = {}
+        for path, size, mtime_ns, inode, title, artist, album, genre, lyrics_flag in rows:
+            entries[path] = ((size, mtime_ns, inode), {
+                'path': path,
+                'filename': os.path.basename(path),
+                'title': title,
+                'artist': artist,
+                'album': album,
+                'genre': genre,
+                'has_lyrics': bool(lyrics_flag),
+            })
+        return entries
+
+    def update(self, records):
+        """Stores [(signature, track dict)]."""
+        if not records:
+            return
+        now = time.time()
+        rows = [(track['path'], *signature, *(track[f] for f in TRACK_FIELDS[:-1]), int(track['has_lyrics']), now)
+                for signature, track in records]
+        with self._lock:
+            conn = self._connect()
+            if conn is None:
+                return
+            try:
+                conn.executemany("INSERT OR REPLACE INTO files VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)", rows)
+                conn.commit()
+            except Exception as e:
+                print(f"Scan manifest write error: {e}")
+
+    def remove(self, paths):
+        if not paths:
+            return
+        with self._lock:
+            conn = self._connect()
+            if conn is None:
+                return
+            try:
+                conn.executemany("DELETE FROM files WHERE path=?", [(p,) for p in paths])
+                conn.commit()
+            except Exception as e:
+                print(f"Scan manifest write error: {e}")
+
+    def clear(self, root=None):
+        with self._lock:
+            conn = self._connect()
+            if conn is None:
+                return
+            if root is None:
+                conn.execute("DELETE FROM files")
+            else:
+                conn.execute("DELETE FROM files WHERE path >= ? AND path < ?", self._prefix_range(root))
+            conn.commit()
+
+
+def _done(value):
+    future = Future()
+    future.set_result(value)
+    return future
+
+
+def _read_with_signature(path, signature):
+    return signature, read_track(path)
+
+
+def scan(directory_path, workers=None, executor="thread", paths=None, manifest=None):
+    """
+    Yields read_track() results for every audio file below directory_path (or for `paths`),
+    reading up to `workers` files at once. Only a bounded window of files is in flight,
+    so memory stays flat on huge libraries.
+
+    With a manifest, unchanged files are yielded from it without being opened, changed
+    ones are re-parsed and recorded, and entries of deleted files are dropped once a
+    full walk of directory_path completes.
+    """
+    walked = paths is None
+    if walked:
+        if not os.path.isdir(directory_path):
+            return
+        directory_path = os.path.abspath(directory_path)
+        paths = iter_audio_files(directory_path)
+    workers = workers or max(1, env_int("SCAN_WORKERS", DEFAULT_WORKERS))
+    if executor == "process":
+        # multiprocessing is a heavy import, only paid for when asked for
+        from concurrent.futures import ProcessPoolExecutor as pool_cls
+    else:
+        pool_cls = ThreadPoolExecutor
+    window = workers * 4
+
+    known = manifest.load(directory_path) if manifest is not None and directory_path else {}
+    seen = set()
+    changed = []
+    reparsed = 0
+    started = time.monotonic()
+    completed = False
+
+    pool = pool_cls(max_workers=workers)
+    pending = deque()
+
+    def take():
+        nonlocal reparsed
+        signature, result = pending.popleft().result()
+        if manifest is not None and signature is not None and result:
+            reparsed += 1
+            changed.append((signature, result))
+            if len(changed) >= MANIFEST_FLUSH:
+                manifest.update(changed)
+                changed.clear()
+        return result
+
+    try:
+        for path in paths:
+            if manifest is None:
+                pending.append(pool.submit(_read_with_signature, path, None))
+            else:
+                try:
+                    signature = file_signature(path)
+                except OSError as e:
+                    print(f"Error scanning {os.path.basename(path)}: {e}")
+                    continue
+                seen.add(path)
+                entry = known.get(path)
+                if entry is not None and entry[0] == signature:
+                    pending.append(_done((None, dict(entry[1]))))
+                else:
+                    pending.append(pool.submit(_read_with_signature, path, signature))
+            if len(pending) >= window:
+                result = take()
+                if result:
+                    yield result
+        while pending:
+            result = take()
+            if result:
+                yield result
+        completed = True
+    finally:
+        # Also reached when the consumer stops early: drop the files not started yet
+        pool.shutdown(wait=False, cancel_futures=True)
+        if manifest is not None:
+            manifest.update(changed)
+            if completed and walked:
+                deleted = [p for p in known if p not in seen]
+                manifest.remove(deleted)
+                print(f"DEBUG: Scanned {len(seen)} files in {time.monotonic() - started:.1f}s "
+                      f"({reparsed} parsed, {len(deleted)} removed)")
+            elif completed:
+                print(f"DEBUG: Scanned {len(seen)} files ({reparsed} parsed)")
+
+
+# Process-wide manifest used by DirectoryScanner
+SCAN_MANIFEST = ScanManifest()
@@ -0,0 +1,309 @@
+"""Persistent on-disk cache for fetched lyrics (single SQLite file)."""
+
+import re
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+
+from app_paths import data_path, env_int
+
+# Defaults (overridable via .env: LYRICS_CACHE_TTL_DAYS, LYRICS_CACHE_MISS_TTL_HOURS, LYRICS_CACHE_MAX_ENTRIES)
+POSITIVE_TTL_DAYS = 90
+NEGATIVE_TTL_HOURS = 24
+MAX_ENTRIES = 20000
+
+
+def normalize_key(text):
+    """Normalizes an artist/title/album for use as a cache key."""
+    if not text:
+        return ""
+    # Lowercase, drop punctuation and collapse whitespace ("AC/DC" == "ac dc")
+    text = re.sub(r'[^\w]+', ' ', str(text).lower())
+    return ' '.join(text.split())
+
+
+class CachedLyrics:
+    """A cache hit. `found` is False for a remembered "not found" result."""
+    __slots__ = ("lyrics", "found", "age")
+
+    def __init__(self, lyrics, found, age):
+        self.lyrics = lyrics
+        self.found = found
+        self.age = age
+
+    def __repr__(self):
+        return f"CachedLyrics(found={self.found}, age={self.age:.0f}s)"
+
+
+class LyricsCache:
+    """
+    SQLite-backed lyrics cache keyed on (provider, artist, title, album).
+    Holds positive hits and negative "not found" results (shorter TTL),
+    evicts least recently used entries beyond `max_entries`.
+    """
+
+    def __init__(self, path=None, max_entries=None, positive_ttl=None, negative_ttl=None):
+        self.path = path
+        self.max_entries = max_entries
+        self.positive_ttl = positive_ttl
+        self.negative_ttl = negative_ttl
+        self.hits = 0
+        self.misses = 0
+        self._conn = None
+        # Row count, kept in memory so writes don't scan the table
+        self._count = 0
+        self._disabled = False
+        self._lock = threading.Lock()
+
+    def _connect(self):
+        """Opens the database lazily. Returns None if the cache is unusable."""
+        if self._conn is not None or self._disabled:
+            return self._conn
+        # Settings are resolved on first use so values from .env (loaded after imports) apply
+        if self.max_entries is None:
+            self.max_entries = env_int("LYRICS_CACHE_MAX_ENTRIES", MAX_ENTRIES)
+        if self.positive_ttl is None:
+            self.positive_ttl = env_int("LYRICS_CACHE_TTL_DAYS", POSITIVE_TTL_DAYS) * 24 * 3600
+        if self.negative_ttl is None:
+            self.negative_ttl = env_int("LYRICS_CACHE_MISS_TTL_HOURS", NEGATIVE_TTL_HOURS) * 3600
+        try:
+            if self.path is None:
+                self.path = data_path("lyrics_cache.sqlite3")
+            conn = sqlite3.connect(self.path, check_same_thread=False, timeout=5)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.execute("""
+                CREATE TABLE IF NOT EXISTS lyrics (
+                    provider TEXT NOT NULL,
+                    artist   TEXT NOT NULL,
+                    title    TEXT NOT NULL,
+                    album    TEXT NOT NULL,
+                    lyrics   TEXT,
+                    found    INTEGER NOT NULL,
+                    created  REAL NOT NULL,
+                    accessed REAL NOT NULL,
+                    PRIMARY KEY (provider, artist, title, album)
+                )""")
+            conn.execute("CREATE INDEX IF NOT EXISTS idx_lyrics_accessed ON lyrics(accessed)")
+            conn.commit()
+            (self._count,) = conn.execute("SELECT COUNT(*) FROM lyrics").fetchone()
+            self._conn = conn
+        except Exception as e:
+            print(f"Lyrics cache disabled ({self.path}): {e}")
+            self._disabled = True
+        return self._conn
+
+    @staticmethod
+    def _key(provider, artist, title, album):
+        return (provider, normalize_key(artist), normalize_key(title), normalize_key(album))
+
+    def get(self, provider, artist, title, album=""):
+        """Returns a CachedLyrics for a fresh entry, or None on miss/expiry."""
+        key = self._key(provider, artist, title, album)
+        with self._lock:
+            conn = self._connect()
+            if conn is None:
+                return None
+            try:
+                row = conn.execute(
+                    "SELECT lyrics, found, created FROM lyrics "
+                    "WHERE provider=? AND artist=? AND title=? AND album=?", key).fetchone()
+                now = time.time()
+                if row is None:
+                    self.misses += 1
+                    return None
+
+                lyrics, found, created = row
+                ttl = self.positive_ttl if found else self.negative_ttl
+                if now - created > ttl:
+                    conn.execute("DELETE FROM lyrics WHERE provider=? AND artist=? AND title=? AND album=?", key)
+                    conn.commit()
+                    self._count -= 1
+                    self.misses += 1
+                    return None
+
+                conn.execute(
+                    "UPDATE lyrics SET accessed=? WHERE provider=? AND artist=? AND title=? AND album=?",
+                    (now,) + key)
+                conn.commit()
+                self.hits += 1
+                return CachedLyrics(lyrics or "", bool(found), now - created)
+            except Exception as e:
+                print(f"Lyrics cache read error: {e}")
+                return None
+
+    def put(self, provider, artist, title, lyrics, album=""):
+        """Stores lyrics found by `provider`."""
+        self._store(provider, artist, title, album, lyrics, True)
+
+    def put_miss(self, provider, artist, title, album=""):
+        """Remembers that `provider` has no lyrics for this track."""
+        self._store(provider, artist, title, album, None, False)
+
+    def _store(self, provider, artist, title, album, lyrics, found):
+        key = self._key(provider, artist, title, album)
+        now = time.time()
+        with self._lock:
+            conn = self._connect()
+            if conn is None:
+                return
+            try:
+                exists = conn.execute(
+                    "SELECT 1 FROM lyrics WHERE provider=? AND artist=? AND title=? AND album=?", key).fetchone()
+                conn.execute(
+                    "INSERT OR REPLACE INTO lyrics (provider, artist, title, album, lyrics, found, created, accessed) "
+                    "VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                    key + (lyrics, 1 if found else 0, now, now))
+                if not exists:
+                    self._count += 1
+                self._evict(conn)
+                conn.commit()
+            except Exception as e:
+                print(f"Lyrics cache write error: {e}")
+
+    def _evict(self, conn):
+        """Drops least recently used entries beyond max_entries (a no-op until the limit is reached)."""
+        excess = self._count - self.max_entries
+        if excess > 0:
+            deleted = conn.execute(
+                "DELETE FROM lyrics WHERE rowid IN "
+                "(SELECT rowid FROM lyrics ORDER BY accessed ASC LIMIT ?)", (excess,)).rowcount
+            self._count -= deleted
+
+    def clear(self):
+        with self._lock:
+            conn = self._connect()
+            if conn is None:
+                return
+            conn.execute("DELETE FROM lyrics")
+            conn.commit()
+            self._count = 0
+            self.hits = 0
+            self.misses = 0
+
+    def stats(self):
+        """Returns hit/miss counters and entry counts."""
+        entries = negatives = 0
+        with self._lock:
+            conn = self._connect()
+            if conn is not None:
+                try:
+                    entries, negatives = conn.execute(
+                        "SELECT COUNT(*), COALESCE(SUM(found = 0), 0) FROM lyrics").fetchone()
+                except Exception as e:
+                    print(f"Lyrics cache stats error: {e}")
+        lookups = self.hits + self.misses
+        return {
+            "path": self.path,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": (self.hits / lookups) if lookups else 0.0,
+            "entries": entries,
+            "negative_entries": negatives,
+            "max_entries": self.max_entries,
+        }
+
+
+class AlbumPageCache:
+    """
+    In-memory LRU cache of parsed album pages: url -> {song title: lyrics}.
+    Concurrent lookups of the same url wait for a single download/parse.
+    Failed pages (None) are remembered for `negative_ttl` seconds.
+    """
+
+    def __init__(self, max_albums=64, ttl=3600, negative_ttl=600):
+        self.max_albums = max_albums
+        self.ttl = ttl
+        self.negative_ttl = negative_ttl
+        self.hits = 0
+        self.misses = 0
+        self._albums = OrderedDict()  # url -> (songs or None, loaded_at)
+        self._loading = {}            # url -> Lock held while a loader runs
+        self._lock = threading.Lock()
+
+    def _expired(self, entry, now):
+        songs, loaded_at = entry
+        return now - loaded_at > (self.ttl if songs is not None else self.negative_ttl)
+
+    def _fresh(self, url):
+        """Returns (True, songs) for a fresh entry, else (False, None). Caller holds _lock."""
+        entry = self._albums.get(url)
+        if entry is None:
+            return False, None
+        songs, _ = entry
+        if self._expired(entry, time.time()):
+            del self._albums[url]
+            return False, None
+        self._albums.move_to_end(url)
+        return True, songs
+
+    def get_or_load(self, url, loader):
+        """Returns the cached song map for url, calling loader() (-> dict or None) once on a miss."""
+        with self._lock:
+            found, songs = self._fresh(url)
+            if found:
+                self.hits += 1
+                return songs
+            url_lock = self._loading.setdefault(url, threading.Lock())
+
+        with url_lock:
+            # Another thread may have loaded it while we waited
+            with self._lock:
+                found, songs = self._fresh(url)
+                if found:
+                    self.hits += 1
+                    return songs
+                self.misses += 1
+
+            try:
+                songs = loader()
+                self._insert(url, songs)
+            finally:
+                with self._lock:
+                    self._loading.pop(url, None)
+            return songs
+
+    def peek(self, url):
+        """Non-blocking lookup for async callers. Returns (found, songs)."""
+        with self._lock:
+            found, songs = self._fresh(url)
+            if found:
+                self.hits += 1
+            return found, songs
+
+    def store(self, url, songs):
+        """Stores a song map loaded outside get_or_load (async callers)."""
+        with self._lock:
+            self.misses += 1
+        self._insert(url, songs)
+
+    def _insert(self, url, songs):
+        with self._lock:
+            self._albums[url] = (songs, time.time())
+            self._albums.move_to_end(url)
+            while len(self._albums) > self.max_albums:
+                self._albums.popitem(last=False)
+
+    def albums_matching(self, url_fragment):
+        """Returns fresh cached song maps whose url contains url_fragment (e.g. '/lyrics/artist/')."""
+        with self._lock:
+            now = time.time()
+            for url in [url for url, entry in self._albums.items() if self._expired(entry, now)]:
+                del self._albums[url]
+            return [songs for url, (songs, _) in self._albums.items() if songs and url_fragment in url]
+
+    def clear(self):
+        with self._lock:
+            self._albums.clear()
+            self.hits = 0
+            self.misses = 0
+
+    def stats(self):
+        with self._lock:
+            return {"hits": self.hits, "misses": self.misses, "albums": len(self._albums)}
+
+
+# Process-wide caches used by LyricsFetcher
+LYRICS_CACHE = LyricsCache()
+ALBUM_PAGE_CACHE = AlbumPageCache()
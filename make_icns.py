@@ -1,27 +1,93 @@
+"""
+Builds MyIcon.iconset and MyIcon.icns from source_icon.jpg.
+
+Every size is resized from the decoded source in this process (Pillow, Lanczos),
+so it runs anywhere Pillow does. The .icns is packed by iconutil on macOS and by
+Pillow's ICNS writer elsewhere.
+
+    python make_icns.py           # iconset + icns
+    python make_icns.py --bench   # also time the old per-size `sips` calls (macOS)
+"""
+
 import os
+import shutil
 import subprocess
+import sys
+import time
+
+from PIL import Image
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+SOURCE_ICON = os.path.join(HERE, "source_icon.jpg")
+ICONSET_DIR = os.path.join(HERE, "MyIcon.iconset")
+ICNS_PATH = os.path.join(HERE, "MyIcon.icns")
+# Dimensions for standard macOS icons (each also at @2x)
+SIZES = [16, 32, 128, 256, 512]
+
+
+def iconset_images(source_img):
+    """Yields (file name, image) for every iconset entry, largest first."""
+    source = Image.open(source_img)
+    source.load()
+    if source.mode not in ("RGB", "RGBA"):
+        source = source.convert("RGBA")
+    entries = []
+    for size in SIZES:
+        entries.append((f"icon_{size}x{size}.png", size))
+        entries.append((f"icon_{size}x{size}@2x.png", size * 2))
+    for name, pixels in sorted(entries, key=lambda e: -e[1]):
+        if source.size == (pixels, pixels):
+            yield name, source
+        else:
+            yield name, source.resize((pixels, pixels), Image.Resampling.LANCZOS, reducing_gap=3.0)
+
 
-def run(cmd):
-    subprocess.check_call(cmd, shell=True)
-
-def make_icns(source_img="source_icon.jpg"):
-    iconset_dir = "MyIcon.iconset"
-    if not os.path.exists(iconset_dir):
-        os.makedirs(iconset_dir)
-    
-    # Dimensions for standard macOS icons
-    sizes = [16, 32, 128, 256, 512]
-    
-    for size in sizes:
-        # Normal
-        run(f"sips -z {size} {size} --setProperty format png '{source_img}' --out '{iconset_dir}/icon_{size}x{size}.png'")
-        # Retina (@2x)
-        double_size = size * 2
-        run(f"sips -z {double_size} {double_size} --setProperty format png '{source_img}' --out '{iconset_dir}/icon_{size}x{size}@2x.png'")
+def write_iconset(source_img, iconset_dir=ICONSET_DIR):
+    os.makedirs(iconset_dir, exist_ok=True)
+    for name, image in iconset_images(source_img):
+        image.save(os.path.join(iconset_dir, name), format="PNG")
+
+
+def write_icns(iconset_dir=ICONSET_DIR, icns_path=ICNS_PATH):
+    if shutil.which("iconutil"):
+        subprocess.check_call(["iconutil", "-c", "icns", iconset_dir, "-o", icns_path])
+        return
+    # Pillow picks the matching sizes for each ICNS slot from these images
+    images = [Image.open(os.path.join(iconset_dir, f"icon_{size}x{size}@2x.png")) for size in reversed(SIZES)]
+    images[0].save(icns_path, format="ICNS", append_images=images[1:])
+
+
+def make_icns(source_img=SOURCE_ICON):
+    started = time.perf_counter()
+    write_iconset(source_img)
+    print(f"Iconset written in {(time.perf_counter() - started) * 1000:.0f} ms")
 
     print("Generating .icns file...")
-    run(f"iconutil -c icns '{iconset_dir}'")
-    print("Done: MyIcon.icns created.")
+    write_icns()
+    print(f"Done: {ICNS_PATH} created.")
+
+
+def benchmark(source_img=SOURCE_ICON):
+    """In-process iconset vs one `sips` subprocess per size (the previous implementation)."""
+    tmp = ICONSET_DIR + ".bench"
+    started = time.perf_counter()
+    write_iconset(source_img, tmp)
+    pillow = time.perf_counter() - started
+    print(f"Pillow, in process: {pillow * 1000:8.0f} ms")
+    if shutil.which("sips"):
+        started = time.perf_counter()
+        for size in SIZES:
+            for name, pixels in ((f"icon_{size}x{size}.png", size), (f"icon_{size}x{size}@2x.png", size * 2)):
+                subprocess.check_call(["sips", "-z", str(pixels), str(pixels), "--setProperty", "format", "png",
+                                       source_img, "--out", os.path.join(tmp, name)], stdout=subprocess.DEVNULL)
+        sips = time.perf_counter() - started
+        print(f"sips, per size:     {sips * 1000:8.0f} ms  ({sips / pillow:.1f}x)")
+    else:
+        print("sips not available (macOS only), skipped")
+    shutil.rmtree(tmp, ignore_errors=True)
+
 
 if __name__ == "__main__":
+    if "--bench" in sys.argv:
+        benchmark()
     make_icns()
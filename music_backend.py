@@ -0,0 +1,370 @@
+"""
+Backends MusicController talks to.
+
+Every Apple Event is a cross-process round trip, so AppscriptBackend reads
+properties vectorized: one event per property for a whole filtered track set
+(`tracks[filter].name.get()` returns every name at once) and the current
+track's `properties` record in a single event. FakeMusicBackend answers from
+memory, counts round trips and can simulate per-event latency, so controller
+code can be exercised and benchmarked on Linux.
+
+Writes by persistent ID go through TrackIndex, which remembers the track
+reference of every persistent ID seen by a bulk read, so saving does not run
+a filter query over the whole library per track.
+
+Property names are backend-neutral: persistent_id, artist, name, album, genre, lyrics.
+"""
+
+import hashlib
+import threading
+import time
+from abc import ABC, abstractmethod
+
+# Imported by the first AppscriptBackend (it is slow to load and macOS-only)
+appscript = None
+
+# Re-check the library size (one event) at most this often; a change drops the index
+INDEX_CHECK_INTERVAL = 30.0
+# Persistent IDs resolved per OR-ed filter query when writing in bulk
+RESOLVE_BATCH = 50
+
+# backend-neutral name -> Music.app (appscript) property name
+TRACK_PROPERTIES = {
+    "persistent_id": "persistent_ID",
+    "artist": "artist",
+    "name": "name",
+    "album": "album",
+    "genre": "genre",
+    "lyrics": "lyrics",
+}
+
+
+def lyrics_hash(text):
+    """Content hash of lyrics, ignoring line-ending style (Music.app returns CR) and outer whitespace."""
+    text = (text or "").replace("\r\n", "\n").replace("\r", "\n").strip()
+    return hashlib.sha1(text.encode("utf-8")).hexdigest()
+
+
+class PermissionDenied(Exception):
+    """The user did not allow automation of Music.app (AppleEvent error -1743)."""
+
+
+class TrackIndex:
+    """
+    persistent ID -> track reference, filled incrementally from bulk reads and lookups.
+
+    The whole index is dropped when `signature()` (e.g. the library track count)
+    changes, checked at most every `check_interval` seconds; single entries are
+    dropped when a write through a stale reference fails.
+    """
+
+    def __init__(self, signature, check_interval=INDEX_CHECK_INTERVAL):
+        self.signature = signature
+        self.check_interval = check_interval
+        self._refs = {}
+        self._signature = None
+        self._checked = 0.0
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return len(self._refs)
+
+    def _validate(self):
+        now = time.monotonic()
+        if now - self._checked < self.check_interval:
+            return
+        self._checked = now
+        try:
+            signature = self.signature()
+        except Exception as e:
+            print(f"DEBUG: Track index check failed: {e}")
+            return
+        with self._lock:
+            if signature != self._signature:
+                if self._refs:
+                    print(f"DEBUG: Library changed, dropping {len(self._refs)} indexed tracks")
+                self._refs.clear()
+                self._signature = signature
+
+    def get(self, persistent_id):
+        self._validate()
+        with self._lock:
+            return self._refs.get(persistent_id)
+
+    def update(self, persistent_ids, refs):
+        self._validate()
+        with self._lock:
+            self._refs.update(zip(persistent_ids, refs))
+
+    def invalidate(self, persistent_id=None):
+        with self._lock:
+            if persistent_id is None:
+                self._refs.clear()
+            else:
+                self._refs.pop(persistent_id, None)
+
+
+class MusicBackend(ABC):
+    """
+    Interface of a Music.app backend.
+
+    player_state() -> "playing" | "paused" | "stopped"
+    current_track(props) -> {prop: value}
+    tracks_where(criteria, props) -> [{prop: value}] for tracks whose properties equal criteria
+    library_count() -> number of tracks in the library playlist
+    library_chunk(start, count, props) -> [{prop: value}] for library tracks start..start+count-1
+    set_current_lyrics(text)
+    set_track_lyrics(persistent_id, text) -> bool
+    set_lyrics_many({persistent_id: text}) -> {persistent_id: bool}
+    """
+
+    @abstractmethod
+    def player_state(self):
+        ...
+
+    @abstractmethod
+    def current_track(self, props):
+        ...
+
+    @abstractmethod
+    def tracks_where(self, criteria, props):
+        ...
+
+    @abstractmethod
+    def library_count(self):
+        ...
+
+    @abstractmethod
+    def library_chunk(self, start, count, props):
+        ...
+
+    @abstractmethod
+    def set_current_lyrics(self, text):
+        ...
+
+    @abstractmethod
+    def set_track_lyrics(self, persistent_id, text):
+        ...
+
+    def set_lyrics_many(self, items):
+        return {pid: self.set_track_lyrics(pid, text) for pid, text in items.items()}
+
+
+class AppscriptBackend(MusicBackend):
+    """Music.app over appscript with batched (vectorized) property reads."""
+
+    def __init__(self, app_name="Music"):
+        global appscript
+        import appscript
+        self.music = appscript.app(app_name)
+        self.index = TrackIndex(self.library_count)
+
+    @staticmethod
+    def _call(func, *args, **kwargs):
+        try:
+            return func(*args, **kwargs)
+        except Exception as e:
+            if "-1743" in str(e):
+                raise PermissionDenied(str(e))
+            raise
+
+    @staticmethod
+    def _clean(value):
+        # Unset properties come back as k.missing_value
+        if value is None or value == appscript.k.missing_value:
+            return ""
+        return value
+
+    def player_state(self):
+        state = self._call(self.music.player_state)
+        if state == appscript.k.playing:
+            return "playing"
+        if state == appscript.k.paused:
+            return "paused"
+        return "stopped"
+
+    def current_track(self, props):
+        track = self.music.current_track
+        values = {}
+        try:
+            # The whole property record in one event
+            record = self._call(track.properties_.get)
+            for prop in props:
+                key = getattr(appscript.k, TRACK_PROPERTIES[prop])
+                if key in record:
+                    values[prop] = self._clean(record[key])
+        except PermissionDenied:
+            raise
+        except Exception as e:
+            print(f"DEBUG: properties record read failed, reading one by one: {e}")
+        for prop in props:
+            if prop not in values:
+                values[prop] = self._clean(self._call(getattr(track, TRACK_PROPERTIES[prop]).get))
+        return values
+
+    def tracks_where(self, criteria, props):
+        test = None
+        for prop, value in criteria.items():
+            clause = getattr(appscript.its, TRACK_PROPERTIES[prop]) == value
+            test = clause if test is None else test.AND(clause)
+        tracks = self.music.tracks[test] if test is not None else self.music.tracks
+        return self._columns(tracks, props)
+
+    def _columns(self, tracks, props):
+        # One event per property for the whole set, zipped back into rows
+        columns = [self._call(getattr(tracks, TRACK_PROPERTIES[prop]).get) for prop in props]
+        if "persistent_id" in props:
+            # One more event gets the references, so later writes to these tracks skip the lookup
+            try:
+                refs = self._call(tracks.get)
+                pids = columns[props.index("persistent_id")]
+                if len(refs) == len(pids):
+                    self.index.update(pids, refs)
+            except Exception as e:
+                print(f"DEBUG: Could not index track references: {e}")
+        return [{prop: self._clean(v) for prop, v in zip(props, row)} for row in zip(*columns)]
+
+    def library_count(self):
+        return self._call(self.music.library_playlists[1].tracks.count, each=appscript.k.track)
+
+    def library_chunk(self, start, count, props):
+        # appscript ranges are 1-based and inclusive: tracks[1:250] is "tracks 1 thru 250"
+        tracks = self.music.library_playlists[1].tracks[start + 1:start + count]
+        return self._columns(tracks, props)
+
+    def set_current_lyrics(self, text):
+        self._call(self.music.current_track.lyrics.set, text)
+
+    def _resolve(self, persistent_ids):
+        """Returns {persistent_id: reference} for the ids found, one OR-ed filter query per RESOLVE_BATCH ids."""
+        refs = {}
+        missing = []
+        for pid in persistent_ids:
+            ref = self.index.get(pid)
+            if ref is not None:
+                refs[pid] = ref
+            else:
+                missing.append(pid)
+        library = self.music.library_playlists[1].tracks
+        for i in range(0, len(missing), RESOLVE_BATCH):
+            test = None
+            for pid in missing[i:i + RESOLVE_BATCH]:
+                clause = appscript.its.persistent_ID == pid
+                test = clause if test is None else test.OR(clause)
+            matches = library[test]
+            found_ids = self._call(matches.persistent_ID.get)
+            found_refs = self._call(matches.get)
+            self.index.update(found_ids, found_refs)
+            refs.update(zip(found_ids, found_refs))
+        return refs
+
+    def _write_lyrics(self, persistent_id, ref, text):
+        try:
+            self._call(ref.lyrics.set, text)
+            return True
+        except PermissionDenied:
+            raise
+        except Exception as e:
+            # Stale reference (track deleted / library rebuilt): look it up again once
+            print(f"DEBUG: Indexed reference for {persistent_id} failed ({e}), re-resolving")
+            self.index.invalidate(persistent_id)
+            ref = self._resolve([persistent_id]).get(persistent_id)
+            if ref is None:
+                return False
+            self._call(ref.lyrics.set, text)
+            return True
+
+    def set_track_lyrics(self, persistent_id, text):
+        ref = self._resolve([persistent_id]).get(persistent_id)
+        if ref is None:
+            return False
+        return self._write_lyrics(persistent_id, ref, text)
+
+    def set_lyrics_many(self, items):
+        """Resolves every reference up front (index + batched lookups), then writes one event per track."""
+        refs = self._resolve(list(items))
+        results = {}
+        for pid, text in items.items():
+            ref = refs.get(pid)
+            try:
+                results[pid] = ref is not None and self._write_lyrics(pid, ref, text)
+            except PermissionDenied:
+                raise
+            except Exception as e:
+                print(f"Error setting lyrics for {pid}: {e}")
+                results[pid] = False
+        return results
+
+
+class FakeMusicBackend(MusicBackend):
+    """
+    In-memory Music library for tests and benchmarks.
+    `round_trips` counts the Apple Events AppscriptBackend would send for the same
+    calls; each one sleeps `latency` seconds.
+    """
+
+    def __init__(self, tracks=(), current=0, state="playing", latency=0.0, permission_denied=False):
+        self.tracks = [dict(t) for t in tracks]
+        self.current = current
+        self.state = state
+        self.latency = latency
+        self.permission_denied = permission_denied
+        self.round_trips = 0
+
+    def _event(self):
+        self.round_trips += 1
+        if self.permission_denied:
+            raise PermissionDenied("Not authorized to send Apple events to Music. (-1743)")
+        if self.latency:
+            time.sleep(self.latency)
+
+    def player_state(self):
+        self._event()
+        return self.state
+
+    def current_track(self, props):
+        self._event()
+        track = self.tracks[self.current]
+        return {prop: track.get(prop, "") for prop in props}
+
+    def _columns(self, tracks, props):
+        # One event per property, plus one for the references when persistent IDs are read
+        for _ in props:
+            self._event()
+        if "persistent_id" in props:
+            self._event()
+        return [{prop: t.get(prop, "") for prop in props} for t in tracks]
+
+    def tracks_where(self, criteria, props):
+        matches = [t for t in self.tracks if all(t.get(k) == v for k, v in criteria.items())]
+        return self._columns(matches, props)
+
+    def library_count(self):
+        self._event()
+        return len(self.tracks)
+
+    def library_chunk(self, start, count, props):
+        return self._columns(self.tracks[start:start + count], props)
+
+    def set_current_lyrics(self, text):
+        self._event()
+        self.tracks[self.current]["lyrics"] = text
+
+    def set_track_lyrics(self, persistent_id, text):
+        return self.set_lyrics_many({persistent_id: text})[persistent_id]
+
+    def set_lyrics_many(self, items):
+        # Same cost model as AppscriptBackend with a cold index: two events (IDs, references)
+        # per RESOLVE_BATCH lookup, then one write per track
+        for _ in range(0, len(items), RESOLVE_BATCH):
+            self._event()
+            self._event()
+        by_id = {t.get("persistent_id"): t for t in self.tracks}
+        results = {}
+        for pid, text in items.items():
+            track = by_id.get(pid)
+            if track is not None:
+                self._event()
+                track["lyrics"] = text
+            results[pid] = track is not None
+        return results
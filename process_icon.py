@@ -1,10 +1,58 @@
+"""
+Makes the About-box icon (app_icon.png) from source_icon.jpg: 256 px with the
+black background made transparent.
+
+    python process_icon.py               # write app_icon.png
+    python process_icon.py --bench [N]   # band operations vs the old per-pixel loop, N px square
+"""
 
-from PIL import Image, ImageOps
-import base64
 import os
+import sys
+import time
+
+from PIL import Image, ImageChops
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+src_path = os.path.join(HERE, "source_icon.jpg")
+# Shown in the About box; build_assets.py copies it into web/dist
+out_path = os.path.join(HERE, "app_icon.png")
+
+ICON_SIZE = 256
+# Pixels with R, G and B all below this count as background
+BLACK_LIMIT = 20
+
+
+def load_source(path=src_path):
+    return Image.open(path).convert("RGBA")
+
+
+def remove_background(img, limit=BLACK_LIMIT):
+    """
+    Returns a copy of the RGBA image with near-black pixels set to (0, 0, 0, 0).
+    Works on whole bands in C: a lookup table per channel, their product as mask.
+    """
+    img = img.convert("RGBA")
+    lut = [255 if v < limit else 0 for v in range(256)]
+    r, g, b, _ = img.split()
+    dark = ImageChops.multiply(ImageChops.multiply(r.point(lut), g.point(lut)), b.point(lut))
+    out = img.copy()
+    out.paste((0, 0, 0, 0), mask=dark)
+    return out
+
+
+def remove_background_loop(img, limit=BLACK_LIMIT):
+    """The original per-pixel version, kept as the reference for --bench."""
+    img = img.convert("RGBA")
+    new_data = []
+    for item in img.getdata():
+        if item[0] < limit and item[1] < limit and item[2] < limit:
+            new_data.append((0, 0, 0, 0))
+        else:
+            new_data.append(item)
+    out = img.copy()
+    out.putdata(new_data)
+    return out
 
-src_path = "/Users/ibridgezhao/Documents/Bjork/source_icon.jpg"
-out_path = "/Users/ibridgezhao/Documents/Bjork/icon_b64.txt"
 
 def process():
     try:
@@ -12,49 +60,42 @@ def process():
             print(f"Source not found: {src_path}")
             return
 
-        img = Image.open(src_path).convert("RGBA")
-        
-        # Resize to 256x256
-        # Use simple resize since it is square 1024x1024
-        img = img.resize((256, 256), Image.Resampling.LANCZOS)
-        
-        # Remove black background
-        # We will iterate and set alpha to 0 for black pixels
-        datas = img.getdata()
-        new_data = []
-        
-        # Threshold for "black"
-        limit = 20 
-        
-        for item in datas:
-            # item is (r,g,b,a)
-            if item[0] < limit and item[1] < limit and item[2] < limit:
-                # Transparent
-                new_data.append((0, 0, 0, 0))
-            else:
-                new_data.append(item)
-                
-        img.putdata(new_data)
-        
-        # We generally don't need to mask to rounded rect if we have a custom shape
-        # But if the user wants it to look "standard", maybe they want the shield to be the icon?
-        # Let's assume transparency is the key request.
-        
+        img = load_source().resize((ICON_SIZE, ICON_SIZE), Image.Resampling.LANCZOS)
+        img = remove_background(img)
         print(f"Processed image size: {img.size}")
 
-        # Save to buffer then base64
-        import io
-        buf = io.BytesIO()
-        img.save(buf, format="PNG")
-        b64_str = base64.b64encode(buf.getvalue()).decode('utf-8')
-        
-        with open(out_path, "w") as f:
-            f.write(b64_str)
-            
-        print("BASE64 calculated and saved to icon_b64.txt")
+        img.save(out_path, format="PNG")
+        print(f"Saved {out_path}")
 
     except Exception as e:
         print(f"Error: {e}")
 
+
+def benchmark(size=1024, rounds=3):
+    """Times both background removals on the source scaled to `size` px and checks they agree."""
+    img = load_source()
+    if img.size != (size, size):
+        img = img.resize((size, size), Image.Resampling.LANCZOS)
+    timings = {}
+    results = {}
+    for name, fn in (("loop", remove_background_loop), ("bands", remove_background)):
+        best = None
+        for _ in range(rounds):
+            started = time.perf_counter()
+            results[name] = fn(img)
+            elapsed = time.perf_counter() - started
+            best = elapsed if best is None else min(best, elapsed)
+        timings[name] = best
+    same = results["loop"].tobytes() == results["bands"].tobytes()
+    print(f"{size}x{size} px, best of {rounds}:")
+    print(f"  per-pixel loop  {timings['loop'] * 1000:8.1f} ms")
+    print(f"  band operations {timings['bands'] * 1000:8.1f} ms  ({timings['loop'] / timings['bands']:.0f}x)")
+    print(f"  identical output: {same}")
+    return 0 if same else 1
+
+
 if __name__ == "__main__":
+    if "--bench" in sys.argv:
+        args = sys.argv[sys.argv.index("--bench") + 1:]
+        sys.exit(benchmark(int(args[0]) if args else 1024))
     process()
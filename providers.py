@@ -0,0 +1,370 @@
+"""
+Lyrics provider registry.
+
+Providers subclass LyricsProvider and are registered on PROVIDERS, either by the
+app itself, by installed packages exposing an `azathoths_whisper.providers`
+entry point, or by drop-in modules in ~/.azathoths_whisper/providers/*.py.
+An entry point / drop-in module supplies a callable returning a provider instance
+(entry point) or a `register(registry)` function (drop-in module).
+"""
+
+import asyncio
+import glob
+import importlib.util
+import os
+import sqlite3
+import threading
+import time
+from abc import ABC, abstractmethod
+from enum import Enum
+
+from app_paths import APP_DATA_DIR, data_path, env_float, env_int
+from lyrics_cache import normalize_key
+
+ENTRY_POINT_GROUP = "azathoths_whisper.providers"
+PLUGIN_DIR = os.path.join(APP_DATA_DIR, "providers")
+
+# Adaptive ordering priors: an unknown provider is assumed to hit half the time at 2s
+PRIOR_LATENCY = 2.0
+MIN_SAMPLES = 3
+
+# Skip a provider for an artist after this many lookups without a single hit
+# (.env: PROVIDER_SKIP_AFTER), but re-probe it once the last try is older than
+# PROVIDER_REPROBE_DAYS, in case the site gained the artist meanwhile.
+SKIP_AFTER = 12
+REPROBE_DAYS = 30
+
+
+class LyricsStatus(str, Enum):
+    """How a lookup ended. A str subclass, so it serializes to JSON as its value."""
+    FOUND = "found"
+    NOT_FOUND = "not_found"   # definitive answer, cached with the miss TTL
+    ERROR = "error"           # network / parsing / configuration problem, never cached
+    TIMEOUT = "timeout"
+    NO_TRACK = "no_track"     # nothing playing in Music
+
+
+class LyricsResult:
+    """
+    Outcome of a lookup: lyrics text (empty unless found), where it came from and what it cost.
+    `timings` maps each provider asked to its latency; `cached` is True if served from LYRICS_CACHE.
+    """
+    __slots__ = ("text", "source", "confidence", "latency", "status", "error", "cached", "timings")
+
+    def __init__(self, text="", source=None, confidence=0.0, latency=0.0, status=None, error=None, cached=False):
+        self.text = text or ""
+        self.source = source
+        self.confidence = confidence
+        self.latency = latency
+        self.status = status or (LyricsStatus.FOUND if self.text else LyricsStatus.NOT_FOUND)
+        if self.status is not LyricsStatus.FOUND:
+            self.text = ""
+        self.error = error
+        self.cached = cached
+        self.timings = {}
+
+    @classmethod
+    def not_found(cls, source=None):
+        return cls("", source, status=LyricsStatus.NOT_FOUND)
+
+    @classmethod
+    def failed(cls, error, source=None, status=LyricsStatus.ERROR):
+        return cls("", source, status=status, error=str(error))
+
+    @property
+    def found(self):
+        return self.status is LyricsStatus.FOUND
+
+    def to_dict(self):
+        """Plain dict for the JS bridge."""
+        return {
+            "status": self.status.value,
+            "lyrics": self.text,
+            "source": self.source,
+            "confidence": self.confidence,
+            "latency": round(self.latency, 3),
+            "cached": self.cached,
+            "error": self.error,
+            "timings": {name: round(t, 3) for name, t in self.timings.items()},
+        }
+
+    def __repr__(self):
+        return (f"LyricsResult(status={self.status.value}, source={self.source}, cached={self.cached}, "
+                f"confidence={self.confidence:.2f}, latency={self.latency:.2f}s)")
+
+
+class LyricsProvider(ABC):
+    """
+    Base class for lyrics sources.
+
+    Implement fetch_sync() (blocking, run in a worker thread); providers with a
+    native async path also override the fetch() coroutine. Both return lyrics
+    text (or a LyricsResult), None for a definitive "not found" (cached), and
+    raise on errors (not cached).
+    """
+    name = "base"
+    timeout = 15        # seconds, overridable via .env: LYRICS_TIMEOUT_<NAME>
+    priority = 100      # static order before any stats exist (lower first)
+    confidence = 0.8    # default confidence of a hit
+    uses_album = False  # whether results depend on the album (cache key)
+
+    @abstractmethod
+    def fetch_sync(self, artist, title, album=""):
+        ...
+
+    async def fetch(self, pipeline, artist, title, album=""):
+        return await asyncio.to_thread(self.fetch_sync, artist, title, album)
+
+
+class ProviderStats:
+    """
+    Per-provider hit/latency counters, globally and per artist / genre scope.
+    Persisted to provider_stats.sqlite3 in the app data dir unless persist=False.
+    """
+
+    def __init__(self, persist=True, path=None):
+        self.persist = persist
+        self.path = path
+        self._stats = None  # (provider, scope) -> [tries, hits, total_latency, last_try, last_hit]
+        self._conn = None
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def scopes(artist=None, genre=None):
+        """Most specific first."""
+        scopes = []
+        if artist:
+            scopes.append("artist:" + normalize_key(artist))
+        if genre:
+            scopes.append("genre:" + normalize_key(genre))
+        scopes.append("*")
+        return scopes
+
+    def _load(self):
+        """Loads persisted counters on first use. Caller holds _lock."""
+        if self._stats is not None:
+            return
+        self._stats = {}
+        if not self.persist:
+            return
+        try:
+            if self.path is None:
+                self.path = data_path("provider_stats.sqlite3")
+            conn = sqlite3.connect(self.path, check_same_thread=False, timeout=5)
+            conn.execute("""
+                CREATE TABLE IF NOT EXISTS provider_stats (
+                    provider TEXT NOT NULL,
+                    scope    TEXT NOT NULL,
+                    tries    INTEGER NOT NULL,
+                    hits     INTEGER NOT NULL,
+                    latency  REAL NOT NULL,
+                    last_try REAL NOT NULL,
+                    last_hit REAL,
+                    PRIMARY KEY (provider, scope)
+                )""")
+            conn.commit()
+            for provider, scope, tries, hits, latency, last_try, last_hit in conn.execute(
+                    "SELECT provider, scope, tries, hits, latency, last_try, last_hit FROM provider_stats"):
+                self._stats[(provider, scope)] = [tries, hits, latency, last_try, last_hit]
+            self._conn = conn
+        except Exception as e:
+            print(f"Provider stats not persisted ({self.path}): {e}")
+
+    def record(self, provider, artist, genre, found, latency):
+        now = time.time()
+        with self._lock:
+            self._load()
+            rows = []
+            for scope in self.scopes(artist, genre):
+                entry = self._stats.setdefault((provider, scope), [0, 0, 0.0, now, None])
+                entry[0] += 1
+                entry[1] += 1 if found else 0
+                entry[2] += latency
+                entry[3] = now
+                if found:
+                    entry[4] = now
+                rows.append((provider, scope, *entry))
+            if self._conn is not None:
+                try:
+                    self._conn.executemany(
+                        "INSERT OR REPLACE INTO provider_stats (provider, scope, tries, hits, latency, last_try, last_hit) "
+                        "VALUES (?, ?, ?, ?, ?, ?, ?)", rows)
+                    self._conn.commit()
+                except Exception as e:
+                    print(f"Provider stats write error: {e}")
+
+    def counts(self, provider, artist=None, genre=None):
+        """Returns (tries, hits, total_latency) for the most specific scope with enough samples."""
+        with self._lock:
+            self._load()
+            for scope in self.scopes(artist, genre):
+                entry = self._stats.get((provider, scope))
+                if entry and entry[0] >= MIN_SAMPLES:
+                    return entry[0], entry[1], entry[2]
+        return 0, 0, 0.0
+
+    def expected_cost(self, provider, artist=None, genre=None):
+        """Expected seconds spent per hit (smoothed latency / smoothed hit rate). Lower is better."""
+        tries, hits, total_latency = self.counts(provider, artist, genre)
+        hit_rate = (hits + 1) / (tries + 2)
+        latency = (total_latency + PRIOR_LATENCY) / (tries + 1)
+        return latency / hit_rate
+
+    def should_skip(self, provider, artist):
+        """True if provider never found anything for artist in SKIP_AFTER+ tries (re-probed after a while)."""
+        if not artist:
+            return False
+        with self._lock:
+            self._load()
+            entry = self._stats.get((provider, "artist:" + normalize_key(artist)))
+        if not entry:
+            return False
+        tries, hits, _, last_try, _ = entry
+        if hits or tries < env_int("PROVIDER_SKIP_AFTER", SKIP_AFTER):
+            return False
+        return time.time() - last_try < env_int("PROVIDER_REPROBE_DAYS", REPROBE_DAYS) * 24 * 3600
+
+    def snapshot(self, provider=None, scope_prefix=None):
+        """Counters for inspection: [{provider, scope, tries, hits, hit_rate, avg_latency, last_try, last_hit}]."""
+        with self._lock:
+            self._load()
+            items = sorted(self._stats.items())
+        rows = []
+        for (p, scope), (tries, hits, latency, last_try, last_hit) in items:
+            if provider and p != provider:
+                continue
+            if scope_prefix and not scope.startswith(scope_prefix):
+                continue
+            rows.append({
+                "provider": p,
+                "scope": scope,
+                "tries": tries,
+                "hits": hits,
+                "hit_rate": (hits / tries) if tries else 0.0,
+                "avg_latency": (latency / tries) if tries else 0.0,
+                "last_try": last_try,
+                "last_hit": last_hit,
+            })
+        return rows
+
+    def reset(self, provider=None, artist=None):
+        """Forgets counters: everything, one provider's, one artist's, or both combined."""
+        scope = ("artist:" + normalize_key(artist)) if artist else None
+        with self._lock:
+            self._load()
+            for key in list(self._stats):
+                if (provider is None or key[0] == provider) and (scope is None or key[1] == scope):
+                    del self._stats[key]
+            if self._conn is not None:
+                clauses, params = [], []
+                if provider is not None:
+                    clauses.append("provider=?")
+                    params.append(provider)
+                if scope is not None:
+                    clauses.append("scope=?")
+                    params.append(scope)
+                where = (" WHERE " + " AND ".join(clauses)) if clauses else ""
+                self._conn.execute("DELETE FROM provider_stats" + where, params)
+                self._conn.commit()
+
+
+class ProviderRegistry:
+    """Holds the available providers and decides in which order to ask them."""
+
+    def __init__(self, stats=None):
+        self._providers = {}
+        self.stats = stats or ProviderStats()
+        self._plugins_loaded = False
+        self._lock = threading.Lock()
+
+    def register(self, provider):
+        """Adds (or replaces) a provider, applying LYRICS_TIMEOUT_<NAME> from .env."""
+        provider.timeout = env_float(f"LYRICS_TIMEOUT_{provider.name.upper()}", provider.timeout)
+        with self._lock:
+            self._providers[provider.name] = provider
+        return provider
+
+    def unregister(self, name):
+        with self._lock:
+            self._providers.pop(name, None)
+
+    def get(self, name):
+        return self._providers.get(name)
+
+    def names(self):
+        return list(self._providers)
+
+    def base_order(self):
+        """LYRICS_PROVIDER_ORDER (e.g. "darklyrics,genius") first, then by priority."""
+        preferred = [n.strip() for n in os.getenv("LYRICS_PROVIDER_ORDER", "").split(",") if n.strip()]
+        rank = {name: i for i, name in enumerate(preferred)}
+        providers = list(self._providers.values())
+        providers.sort(key=lambda p: (rank.get(p.name, len(rank)), p.priority))
+        return [p.name for p in providers]
+
+    def ordered(self, artist=None, genre=None, names=None):
+        """
+        Provider names, cheapest expected cost per hit first (stable w.r.t. base_order).
+        Providers that keep failing for this artist are skipped, unless that would leave none.
+        """
+        names = [n for n in (names or self.base_order()) if n in self._providers]
+        kept = [n for n in names if not self.stats.should_skip(n, artist)]
+        if kept and len(kept) < len(names):
+            print(f"DEBUG: Skipping {sorted(set(names) - set(kept))} for {artist} (no hits in history)")
+        return sorted(kept or names, key=lambda n: self.stats.expected_cost(n, artist, genre))
+
+    def record(self, provider, artist, genre, found, latency):
+        self.stats.record(provider, artist, genre, found, latency)
+
+    def load_plugins(self):
+        """Registers third-party providers from entry points and the drop-in plugin dir (once)."""
+        if self._plugins_loaded:
+            return
+        self._plugins_loaded = True
+
+        try:
+            from importlib.metadata import entry_points
+            for ep in entry_points(group=ENTRY_POINT_GROUP):
+                try:
+                    self.register(ep.load()())
+                    print(f"Loaded lyrics provider plugin: {ep.name}")
+                except Exception as e:
+                    print(f"Failed to load provider plugin {ep.name}: {e}")
+        except Exception as e:
+            print(f"Provider entry point discovery failed: {e}")
+
+        for path in sorted(glob.glob(os.path.join(PLUGIN_DIR, "*.py"))):
+            try:
+                name = "aw_provider_" + os.path.splitext(os.path.basename(path))[0]
+                spec = importlib.util.spec_from_file_location(name, path)
+                module = importlib.util.module_from_spec(spec)
+                spec.loader.exec_module(module)
+                module.register(self)
+                print(f"Loaded lyrics provider plugin: {path}")
+            except Exception as e:
+                print(f"Failed to load provider plugin {path}: {e}")
+
+
+# Process-wide registry
+PROVIDERS = ProviderRegistry()
+
+
+if __name__ == "__main__":
+    # Inspect / reset the learned provider stats:
+    #   python providers.py [--provider NAME] [--artist NAME] [--reset]
+    import argparse
+    parser = argparse.ArgumentParser(description="Inspect or reset learned lyrics provider stats.")
+    parser.add_argument("--provider")
+    parser.add_argument("--artist")
+    parser.add_argument("--reset", action="store_true")
+    args = parser.parse_args()
+
+    stats = PROVIDERS.stats
+    if args.reset:
+        stats.reset(args.provider, args.artist)
+        print("Provider stats reset.")
+    else:
+        prefix = ("artist:" + normalize_key(args.artist)) if args.artist else None
+        for row in stats.snapshot(args.provider, prefix):
+            print(f"{row['provider']:<12} {row['scope']:<40} tries={row['tries']:<5} "
+                  f"hit_rate={row['hit_rate']:.0%}  avg={row['avg_latency']:.2f}s")
@@ -0,0 +1,104 @@
+"""
+Cold-start diagnostics.
+
+STARTUP records named milestones (imports done, window shown, main UI loaded,
+UI interactive) relative to the moment this module was first imported, which
+is the first thing lyrics_fetcher does, plus the page's own render timings
+(first paint, stylesheets loaded, DOM ready).
+
+    python lyrics_fetcher.py --importtime [N]
+
+runs a fresh interpreter with `-X importtime`, imports the app module and
+prints the N slowest imports (self and cumulative time).
+"""
+
+import os
+import subprocess
+import sys
+import threading
+import time
+
+
+class StartupTimeline:
+    """Milestones since process start (well, since this module was imported)."""
+
+    def __init__(self):
+        self.origin = time.perf_counter()
+        self.marks = {}
+        self.render = {}  # browser-side timings of the main UI (ms since navigation start)
+        self._lock = threading.Lock()
+
+    def mark(self, name):
+        """Records the first time `name` is reached; returns seconds since start."""
+        with self._lock:
+            if name not in self.marks:
+                self.marks[name] = time.perf_counter() - self.origin
+                print(f"DEBUG: startup {name} at {self.marks[name] * 1000:.0f} ms")
+            return self.marks[name]
+
+    def record_render(self, timings):
+        """Stores the render timings reported by the page (first paint, DOM ready, ...)."""
+        with self._lock:
+            self.render = {k: round(v, 1) for k, v in (timings or {}).items() if isinstance(v, (int, float))}
+        print(f"DEBUG: main UI render timings (ms): {self.render}")
+
+    def snapshot(self):
+        with self._lock:
+            marks = {name: round(seconds * 1000, 1) for name, seconds in self.marks.items()}
+            if self.render:
+                marks["render"] = dict(self.render)
+            return marks
+
+
+def parse_importtime(stderr):
+    """Parses `-X importtime` output into [(module, self_us, cumulative_us, depth)]."""
+    rows = []
+    for line in stderr.splitlines():
+        if not line.startswith("import time:") or "imported package" in line:
+            continue
+        try:
+            parts = line[len("import time:"):].split("|")
+            self_us, cumulative_us, name = int(parts[0]), int(parts[1]), parts[2]
+        except (ValueError, IndexError):
+            continue
+        depth = (len(name) - len(name.lstrip(" ")) - 1) // 2
+        rows.append((name.strip(), self_us, cumulative_us, depth))
+    return rows
+
+
+def importtime_report(module="lyrics_fetcher", top=25):
+    """Imports `module` in a fresh interpreter under -X importtime and prints the slowest imports."""
+    if getattr(sys, 'frozen', False):
+        print("Import profiling needs a Python interpreter; run it from the source tree.")
+        return 1
+    here = os.path.dirname(os.path.abspath(__file__))
+    started = time.perf_counter()
+    proc = subprocess.run([sys.executable, "-X", "importtime", "-c", f"import {module}"],
+                          cwd=here, capture_output=True, text=True)
+    wall = time.perf_counter() - started
+    rows = parse_importtime(proc.stderr)
+    if proc.returncode != 0 or not rows:
+        print(f"Import of {module} failed:\n{proc.stderr[-2000:]}")
+        return 1
+
+    total = sum(r[1] for r in rows)
+    print(f"{len(rows)} modules imported, {total / 1000:.0f} ms import time ({wall * 1000:.0f} ms wall)\n")
+    # A module is reported after its children: its direct imports are the depth-1 rows just before it
+    direct = []
+    end = max(i for i, r in enumerate(rows) if r[0] == module and r[3] == 0)
+    for row in reversed(rows[:end]):
+        if row[3] == 0:
+            break
+        if row[3] == 1:
+            direct.append(row)
+    print(f"Slowest direct imports of {module} (cumulative):")
+    for name, _, cumulative_us, _ in sorted(direct, key=lambda r: -r[2])[:top]:
+        print(f"  {cumulative_us / 1000:8.1f} ms  {name}")
+    print("\nSlowest modules (self):")
+    for name, self_us, _, _ in sorted(rows, key=lambda r: -r[1])[:top]:
+        print(f"  {self_us / 1000:8.1f} ms  {name}")
+    return 0
+
+
+# Process-wide timeline used by LyricsApp
+STARTUP = StartupTimeline()
@@ -0,0 +1,256 @@
+"""
+Header-only lyrics detection.
+
+mutagen.File() parses every tag frame of a file, including embedded artwork,
+before anything can be asked about it. probe_lyrics() only walks the headers
+of the tag region with small bounded reads and seeks past everything it does
+not need (pictures, audio data, MP4 sample tables):
+
+  ID3v2   - frame headers; only USLT bodies are read (MP3, AAC, AIFF "ID3 " chunk)
+  MP4     - moov/udta/meta/ilst atom headers; only the ©lyr atom is read
+  FLAC    - metadata block headers; only the VORBIS_COMMENT block is read
+
+Answers match library_scanner.has_lyrics(). Anything unusual (unsynchronised
+ID3, unknown containers, truncated files) returns None so the caller can fall
+back to mutagen.
+"""
+
+import os
+import struct
+
+# Same keys library_scanner checks in Vorbis comments
+VORBIS_LYRICS_KEYS = (b'lyrics', b'unsyncedlyrics', b'unsynced lyrics')
+
+# Largest lyrics frame / atom / comment block we are willing to read
+MAX_READ = 4 * 1024 * 1024
+
+ID3_HEADER = struct.Struct(">3sBBB4s")
+ID3_ENCODINGS = {0: ('latin-1', b'\0'), 1: ('utf-16', b'\0\0'), 2: ('utf-16-be', b'\0\0'), 3: ('utf-8', b'\0')}
+ATOM_HEADER = struct.Struct(">I4s")
+# Atoms whose children are walked on the way to ilst
+MP4_PATH = (b'moov', b'udta', b'meta', b'ilst', b'\xa9lyr')
+
+
+class _Unsupported(Exception):
+    """The file needs a full parser; probe_lyrics() answers None."""
+
+
+def _read(f, size):
+    if size > MAX_READ:
+        raise _Unsupported("block too large")
+    data = f.read(size)
+    if len(data) != size:
+        raise _Unsupported("truncated")
+    return data
+
+
+def _syncsafe(data):
+    return (data[0] << 21) | (data[1] << 14) | (data[2] << 7) | data[3]
+
+
+def _uslt_has_text(body):
+    """True if a USLT frame body (encoding, language, descriptor, text) has non-empty text."""
+    if len(body) < 4 or body[0] not in ID3_ENCODINGS:
+        return False
+    encoding, terminator = ID3_ENCODINGS[body[0]]
+    rest = body[4:]
+    # Skip the content descriptor; UTF-16 terminators are aligned to 2 bytes
+    step = len(terminator)
+    end = 0
+    while end + step <= len(rest) and rest[end:end + step] != terminator:
+        end += step
+    text = rest[end + step:]
+    try:
+        return bool(text.decode(encoding).rstrip('\0'))
+    except UnicodeDecodeError:
+        return bool(text.strip(b'\0'))
+
+
+def _probe_id3(f):
+    """
+    f is positioned at an ID3v2 header. Returns True/False, or raises _Unsupported.
+    On False, f is left at the tag's declared end (past padding and footer).
+    """
+    header = f.read(ID3_HEADER.size)
+    if len(header) != ID3_HEADER.size:
+        raise _Unsupported("truncated")
+    magic, major, _, flags, size = ID3_HEADER.unpack(header)
+    if magic != b'ID3' or major not in (2, 3, 4):
+        raise _Unsupported("unknown ID3 version")
+    if flags & 0x80 and major < 4:
+        # Tag-wide unsynchronisation shifts every frame offset
+        raise _Unsupported("unsynchronised tag")
+    end = f.tell() + _syncsafe(size)
+    # Where whatever follows the tag starts (v2.4 may append a 10-byte footer)
+    tag_end = end + (10 if major == 4 and flags & 0x10 else 0)
+    if flags & 0x40 and major >= 3:
+        ext = _read(f, 4)
+        # v2.3 extended header size excludes itself, v2.4 includes it
+        f.seek(_syncsafe(ext) - 4 if major == 4 else struct.unpack(">I", ext)[0], 1)
+
+    if major == 2:
+        id_len, uslt = 3, b'ULT'
+    else:
+        id_len, uslt = 4, b'USLT'
+    header_len = 6 if major == 2 else 10
+    while f.tell() + header_len <= end:
+        frame = f.read(header_len)
+        frame_id = frame[:id_len]
+        if not frame_id.strip(b'\0'):
+            break  # padding runs to the end of the tag
+        if major == 2:
+            frame_size = int.from_bytes(frame[3:6], 'big')
+            frame_flags = 0
+        elif major == 3:
+            frame_size = struct.unpack(">I", frame[4:8])[0]
+            frame_flags = int.from_bytes(frame[8:10], 'big')
+        else:
+            frame_size = _syncsafe(frame[4:8])
+            frame_flags = int.from_bytes(frame[8:10], 'big')
+        if frame_id == uslt:
+            # Compressed / encrypted / unsynchronised frames need the real parser
+            if (major == 3 and frame_flags & 0x00C0) or (major == 4 and frame_flags & 0x000F):
+                raise _Unsupported("encoded USLT frame")
+            if _uslt_has_text(_read(f, frame_size)):
+                return True
+        else:
+            f.seek(frame_size, 1)  # APIC and everything else is skipped unread
+    f.seek(tag_end)
+    return False
+
+
+def _atoms(f, end):
+    """Yields (type, payload_start, payload_end) of the atoms between f.tell() and end."""
+    pos = f.tell()
+    while pos + ATOM_HEADER.size <= end:
+        f.seek(pos)
+        header = f.read(ATOM_HEADER.size)
+        if len(header) != ATOM_HEADER.size:
+            return
+        size, kind = ATOM_HEADER.unpack(header)
+        start = pos + ATOM_HEADER.size
+        if size == 1:
+            size = struct.unpack(">Q", f.read(8))[0]
+            start += 8
+        elif size == 0:
+            size = end - pos
+        if size < start - pos:
+            raise _Unsupported("bad atom size")
+        yield kind, start, pos + size
+        pos += size
+
+
+def _probe_mp4(f, file_size):
+    """Walks moov/udta/meta/ilst by atom headers only; reads the ©lyr atom's data."""
+    start, end = 0, file_size
+    for depth, wanted in enumerate(MP4_PATH):
+        f.seek(start)
+        for kind, child_start, child_end in _atoms(f, end):
+            if kind == wanted:
+                start, end = child_start, child_end
+                break
+        else:
+            return False
+        if wanted == b'meta':
+            # meta is a full box (4 bytes version/flags) in iTunes files, a plain atom in some QuickTime ones
+            f.seek(start)
+            if f.read(4) == b'\0\0\0\0':
+                start += 4
+    f.seek(start)
+    for kind, data_start, data_end in _atoms(f, end):
+        if kind != b'data':
+            continue
+        f.seek(data_start)
+        # type indicator (4) + locale (4), then the text
+        payload = _read(f, data_end - data_start)[8:]
+        if payload.decode('utf-8', 'replace').strip():
+            return True
+    return False
+
+
+def _probe_flac(f):
+    """f is positioned after 'fLaC'. Reads only the VORBIS_COMMENT block."""
+    while True:
+        header = f.read(4)
+        if len(header) != 4:
+            raise _Unsupported("truncated")
+        last = header[0] & 0x80
+        kind = header[0] & 0x7F
+        size = int.from_bytes(header[1:4], 'big')
+        if kind == 4:
+            return _vorbis_has_lyrics(_read(f, size))
+        f.seek(size, 1)  # STREAMINFO, SEEKTABLE, PICTURE, PADDING ...
+        if last:
+            return False
+
+
+def _vorbis_has_lyrics(block):
+    try:
+        vendor_len = struct.unpack_from("<I", block, 0)[0]
+        pos = 4 + vendor_len
+        count = struct.unpack_from("<I", block, pos)[0]
+        pos += 4
+        for _ in range(count):
+            length = struct.unpack_from("<I", block, pos)[0]
+            pos += 4
+            comment = block[pos:pos + length]
+            pos += length
+            key, sep, value = comment.partition(b'=')
+            if sep and key.lower() in VORBIS_LYRICS_KEYS and value.decode('utf-8', 'replace').strip():
+                return True
+    except struct.error:
+        raise _Unsupported("bad vorbis comment")
+    return False
+
+
+def _probe_aiff(f, file_size):
+    """IFF chunks: seeks from chunk header to chunk header until the 'ID3 ' chunk."""
+    f.seek(12)
+    pos = 12
+    while pos + 8 <= file_size:
+        f.seek(pos)
+        chunk_id, size = struct.unpack(">4sI", f.read(8))
+        if chunk_id in (b'ID3 ', b'id3 '):
+            return _probe_id3(f)
+        pos += 8 + size + (size & 1)
+    return False
+
+
+def probe_lyrics(path):
+    """
+    True / False if the file's tags do / do not carry non-empty lyrics,
+    None if the header-only probe cannot tell (use mutagen then).
+    """
+    try:
+        file_size = os.path.getsize(path)
+        with open(path, 'rb') as f:
+            head = f.read(12)
+            if head[:3] == b'ID3':
+                f.seek(0)
+                if _probe_id3(f):
+                    return True
+                # FLAC files occasionally carry a leading ID3 tag
+                if f.read(4) == b'fLaC':
+                    return _probe_flac(f)
+                return False
+            if head[:4] == b'fLaC':
+                f.seek(4)
+                return _probe_flac(f)
+            if head[4:8] == b'ftyp':
+                return _probe_mp4(f, file_size)
+            if head[:4] == b'FORM' and head[8:12] in (b'AIFF', b'AIFC'):
+                return _probe_aiff(f, file_size)
+            if head[:2] in (b'\xff\xfb', b'\xff\xfa', b'\xff\xf3', b'\xff\xf2', b'\xff\xe3'):
+                return False  # bare MPEG audio: no ID3v2 tag, so no USLT
+    except _Unsupported:
+        return None
+    except (OSError, ValueError, struct.error) as e:
+        print(f"DEBUG: Tag probe failed for {os.path.basename(path)}: {e}")
+        return None
+    return None
+
+
+if __name__ == '__main__':
+    import sys
+    for arg in sys.argv[1:]:
+        print(f"{probe_lyrics(arg)}\t{arg}")
@@ -0,0 +1,206 @@
+"""
+Lyrics tag writer for local files.
+
+A plain mutagen save() shifts everything after the tag whenever the tag grows or
+shrinks, which rewrites a whole multi-hundred-MB FLAC / MP4 in place, and a crash
+half-way leaves a damaged file. write_lyrics() instead:
+
+  1. tries an in-place save that must fit the tag's existing padding (only the
+     tag region is overwritten, the file size does not change);
+  2. otherwise saves into a temp copy next to the file, with generous padding so
+     the next edit fits in place, fsyncs it and renames it over the original.
+
+Tag types are picked from the parsed file, not the extension:
+ID3 (MP3, AIFF "ID3 " chunk, ID3-prefixed AAC), MP4 (AAC / ALAC in .m4a / .alac)
+and Vorbis comments (FLAC).
+"""
+
+import io
+import os
+import shutil
+import tempfile
+
+import mutagen
+from mutagen.id3 import ID3, USLT, ID3NoHeaderError
+from mutagen.mp4 import MP4Tags
+
+from app_paths import env_int
+
+# Padding reserved when a tag has to be rewritten anyway (.env: TAG_PADDING)
+DEFAULT_PADDING = 64 * 1024
+
+
+class TagWriteResult:
+    """
+    Outcome of write_lyrics(); truthy when the lyrics were written (or would be, in a dry run).
+    mode: "in_place" | "rewrite" | "unchanged" (the file already had these lyrics).
+    """
+    __slots__ = ("ok", "mode", "bytes_written", "error", "errno", "had_lyrics")
+
+    def __init__(self, ok, mode=None, bytes_written=0, error=None, errno=None, had_lyrics=False):
+        self.ok = ok
+        self.mode = mode
+        self.bytes_written = bytes_written
+        self.error = error
+        self.errno = errno  # OSError errno of a failed write, for retry decisions
+        self.had_lyrics = had_lyrics
+
+    def __bool__(self):
+        return self.ok
+
+    def __repr__(self):
+        return f"TagWriteResult({self.ok}, {self.mode}, {self.bytes_written} bytes, {self.error})"
+
+
+class _NeedsRewrite(Exception):
+    """The new tag does not fit the existing padding."""
+
+
+class _DryRun(Exception):
+    """Raised from the padding callback, before mutagen writes anything."""
+
+    def __init__(self, fits):
+        super().__init__()
+        self.fits = fits
+
+
+class _CountingFile:
+    """
+    File wrapper counting the bytes mutagen writes (tag data plus any shifted audio).
+    With read_only (dry runs on a file opened 'rb') it only accepts the empty write
+    mutagen uses to check that the file is writable.
+    """
+
+    def __init__(self, fileobj, read_only=False):
+        self._fileobj = fileobj
+        self.read_only = read_only
+        self.written = 0
+
+    def write(self, data):
+        if self.read_only:
+            if data:
+                raise io.UnsupportedOperation("write during a dry run")
+            return 0
+        self.written += len(data)
+        return self._fileobj.write(data)
+
+    def __getattr__(self, name):
+        return getattr(self._fileobj, name)
+
+
+def _fit_padding(info):
+    if info.padding < 0:
+        raise _NeedsRewrite()
+    return info.padding  # keep whatever is left, shrinking would shift the file too
+
+
+def _probe_padding(info):
+    raise _DryRun(info.padding >= 0)
+
+
+def _generous_padding(info):
+    return max(info.padding, env_int("TAG_PADDING", DEFAULT_PADDING))
+
+
+def _load(path):
+    """Returns (tag owner to save, tags) with the lyrics-carrying tags loaded or created."""
+    if not path.lower().endswith('.aac'):
+        audio = mutagen.File(path)
+        if audio is None:
+            raise ValueError("unsupported file")
+        if audio.tags is None:
+            audio.add_tags()
+        return audio, audio.tags
+    # ADTS AAC: mutagen has no tag support for the stream, players read a leading ID3 tag
+    try:
+        tags = ID3(path)
+    except ID3NoHeaderError:
+        tags = ID3()
+    return tags, tags
+
+
+def _current_lyrics(tags):
+    if isinstance(tags, ID3):
+        frames = tags.getall('USLT')
+        return frames[0].text if frames else ""
+    if isinstance(tags, MP4Tags):
+        values = tags.get('\xa9lyr') or [""]
+        return values[0]
+    for key in ('LYRICS', 'UNSYNCEDLYRICS', 'UNSYNCED LYRICS'):
+        if key in tags and tags[key]:
+            return tags[key][0]
+    return ""
+
+
+def _set_lyrics(tags, text):
+    if isinstance(tags, ID3):
+        # Replace every USLT (any language / description) so players see exactly one
+        tags.delall('USLT')
+        tags.add(USLT(encoding=3, lang='eng', desc='desc', text=text))
+    elif isinstance(tags, MP4Tags):
+        tags['\xa9lyr'] = [text]
+    else:
+        # Vorbis comments; drop alternative keys so readers don't pick a stale one
+        for key in ('UNSYNCEDLYRICS', 'UNSYNCED LYRICS'):
+            if key in tags:
+                del tags[key]
+        tags['LYRICS'] = text
+
+
+def _save(owner, fileobj, padding, read_only=False):
+    counting = _CountingFile(fileobj, read_only)
+    owner.save(counting, padding=padding)
+    return counting.written
+
+
+def _failed(e):
+    return TagWriteResult(False, error=str(e), errno=getattr(e, 'errno', None))
+
+
+def write_lyrics(path, text, dry_run=False):
+    """
+    Writes unsynced lyrics into the file's tags. Returns a TagWriteResult.
+    dry_run=True only reports what would happen (mode, had_lyrics); nothing is written.
+    """
+    try:
+        owner, tags = _load(path)
+        current = _current_lyrics(tags)
+        if current.strip() == text.strip():
+            return TagWriteResult(True, "unchanged", had_lyrics=bool(current.strip()))
+        had_lyrics = bool(current.strip())
+        _set_lyrics(tags, text)
+    except Exception as e:
+        return _failed(e)
+
+    try:
+        # A dry run never writes, so it also works on read-only files and media
+        with open(path, 'rb' if dry_run else 'rb+') as f:
+            written = _save(owner, f, _probe_padding if dry_run else _fit_padding, read_only=dry_run)
+        return TagWriteResult(True, "in_place", written, had_lyrics=had_lyrics)
+    except _DryRun as e:
+        return TagWriteResult(True, "in_place" if e.fits else "rewrite", had_lyrics=had_lyrics)
+    except _NeedsRewrite:
+        pass
+    except Exception as e:
+        return _failed(e)
+
+    directory, name = os.path.split(os.path.abspath(path))
+    fd, tmp = tempfile.mkstemp(prefix=f".{name}.", suffix=".tmp", dir=directory)
+    try:
+        with os.fdopen(fd, 'wb+') as f:
+            with open(path, 'rb') as src:
+                shutil.copyfileobj(src, f, 1024 * 1024)
+            copied = f.tell()
+            f.seek(0)
+            written = _save(owner, f, _generous_padding)
+            f.flush()
+            os.fsync(f.fileno())
+        shutil.copymode(path, tmp)
+        os.replace(tmp, path)
+        return TagWriteResult(True, "rewrite", copied + written, had_lyrics=had_lyrics)
+    except Exception as e:
+        try:
+            os.unlink(tmp)
+        except OSError:
+            pass
+        return _failed(e)
@@ -0,0 +1,201 @@
+"""
+Track change detection for the now-playing view.
+
+Music.app posts the "com.apple.Music.playerInfo" distributed notification on
+every play / pause / skip, so the watcher normally does no Apple Events at all
+until something changes. Without a notification source (PyObjC missing, other
+platforms) it polls instead, backing off while the player is paused or stopped.
+
+Notification sources implement start(callback) -> bool and stop(); callback
+receives a dict shaped like the notification's userInfo ("Player State",
+"Artist", "Name", "Album"). FakeNotificationSource drives the watcher in tests.
+"""
+
+import queue
+import threading
+
+from app_paths import env_float
+
+PLAYER_INFO_NOTIFICATION = "com.apple.Music.playerInfo"
+
+# Defaults (overridable via .env: TRACK_POLL_INTERVAL, TRACK_POLL_MAX_INTERVAL)
+POLL_INTERVAL = 3.0        # seconds between polls while playing
+POLL_MAX_INTERVAL = 30.0   # ceiling of the back-off while paused / stopped
+
+
+class TrackState:
+    """Player state plus the (artist, title, album) of the current track, or None if stopped."""
+    __slots__ = ("state", "track")
+
+    def __init__(self, state, track=None):
+        self.state = state
+        self.track = tuple(track) if track else None
+
+    @classmethod
+    def from_player_info(cls, info):
+        """Builds a TrackState from a playerInfo notification userInfo dict."""
+        state = str(info.get("Player State", "")).lower() or "stopped"
+        if state == "stopped":
+            return cls("stopped")
+        track = (info.get("Artist", "") or "", info.get("Name", "") or "", info.get("Album", "") or "")
+        return cls(state, track)
+
+    def __eq__(self, other):
+        return isinstance(other, TrackState) and (self.state, self.track) == (other.state, other.track)
+
+    def __repr__(self):
+        return f"TrackState({self.state}, {self.track})"
+
+
+class DistributedNotificationSource:
+    """Music.app player-info notifications via NSDistributedNotificationCenter (macOS, PyObjC)."""
+
+    def __init__(self, name=PLAYER_INFO_NOTIFICATION):
+        self.name = name
+        self._observer = None
+
+    def start(self, callback):
+        try:
+            import Foundation
+        except Exception:
+            return False
+
+        def _on_notification(notification):
+            try:
+                info = notification.userInfo()
+                callback(dict(info) if info is not None else {})
+            except Exception as e:
+                print(f"DEBUG: playerInfo notification error: {e}")
+
+        try:
+            center = Foundation.NSDistributedNotificationCenter.defaultCenter()
+            self._observer = center.addObserverForName_object_queue_usingBlock_(
+                self.name, None, None, _on_notification)
+            return True
+        except Exception as e:
+            print(f"DEBUG: Could not subscribe to {self.name}: {e}")
+            return False
+
+    def stop(self):
+        if self._observer is None:
+            return
+        try:
+            import Foundation
+            Foundation.NSDistributedNotificationCenter.defaultCenter().removeObserver_(self._observer)
+        except Exception:
+            pass
+        self._observer = None
+
+
+class FakeNotificationSource:
+    """In-process stand-in for the distributed notification center; call post() to emit."""
+
+    def __init__(self, available=True):
+        self.available = available
+        self._callback = None
+
+    def start(self, callback):
+        if not self.available:
+            return False
+        self._callback = callback
+        return True
+
+    def stop(self):
+        self._callback = None
+
+    def post(self, info):
+        if self._callback is not None:
+            self._callback(info)
+
+
+class TrackWatcher:
+    """
+    Calls on_change(TrackState) whenever the current track changes (or playback stops).
+
+    read_state() -> TrackState is the authoritative (Apple Events) read; it is used for
+    the initial state and for polling when no notification source is available.
+    Notifications are handled on the watcher's own thread, so on_change may block
+    (e.g. on evaluate_js) without stalling the main run loop that delivered them.
+    """
+
+    def __init__(self, read_state, on_change, source=None, poll_interval=None, max_interval=None):
+        self.read_state = read_state
+        self.on_change = on_change
+        self.source = source if source is not None else DistributedNotificationSource()
+        self.poll_interval = poll_interval or env_float("TRACK_POLL_INTERVAL", POLL_INTERVAL)
+        self.max_interval = max(self.poll_interval, max_interval or env_float("TRACK_POLL_MAX_INTERVAL", POLL_MAX_INTERVAL))
+        self.notifications = False  # True once the source is delivering
+        self.current = None
+        self._events = queue.Queue()
+        self._stop = threading.Event()
+        self._thread = None
+
+    @property
+    def running(self):
+        return self._thread is not None and self._thread.is_alive()
+
+    def start(self):
+        if self.running:
+            return self
+        self._stop.clear()
+        self.notifications = bool(self.source and self.source.start(self._events.put))
+        print(f"DEBUG: Track watcher using {'playerInfo notifications' if self.notifications else 'polling'}")
+        self._thread = threading.Thread(target=self._run, name="track-watcher", daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self._stop.set()
+        self._events.put(None)  # wake the thread
+        if self.source:
+            self.source.stop()
+
+    def poke(self):
+        """Forces a fresh read (e.g. after the window is shown again)."""
+        self._events.put({})
+
+    def _read(self):
+        try:
+            return self.read_state()
+        except Exception as e:
+            print(f"DEBUG: Track watcher read failed: {e}")
+            return None
+
+    def _update(self, state):
+        if state is None or state == self.current:
+            return False
+        changed_track = self.current is None or state.track != self.current.track
+        self.current = state
+        if changed_track:
+            try:
+                self.on_change(state)
+            except Exception as e:
+                print(f"DEBUG: Track watcher callback failed: {e}")
+        return changed_track
+
+    def next_interval(self, interval, changed):
+        """Polling back-off: reset while playing or after a change, otherwise double up to max_interval."""
+        if changed or (self.current is not None and self.current.state == "playing"):
+            return self.poll_interval
+        return min(self.max_interval, interval * 2)
+
+    def _run(self):
+        self._update(self._read())
+        interval = self.poll_interval
+        while not self._stop.is_set():
+            try:
+                info = self._events.get(timeout=None if self.notifications else interval)
+            except queue.Empty:
+                info = None
+                changed = self._update(self._read())
+                interval = self.next_interval(interval, changed)
+                continue
+            if self._stop.is_set():
+                break
+            # An empty dict (poke) or a notification without track fields needs a real read
+            if info and "Player State" in info:
+                state = TrackState.from_player_info(info)
+            else:
+                state = self._read()
+            changed = self._update(state)
+            interval = self.next_interval(interval, changed)
@@ -0,0 +1,14 @@
+// Tailwind build config for the main window (see build_assets.py).
+// The theme lives in theme.json so the CDN fallback in web_assets.py uses the same values.
+module.exports = {
+    darkMode: "class",
+    // Class names are scanned from the embedded HTML / JS in the app module
+    content: ["../lyrics_fetcher.py"],
+    theme: {
+        extend: require("./theme.json"),
+    },
+    plugins: [
+        require("@tailwindcss/forms"),
+        require("@tailwindcss/container-queries"),
+    ],
+};
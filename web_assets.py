@@ -0,0 +1,74 @@
+"""
+Stylesheets, scripts and images of the main window.
+
+The release bundle ships them prebuilt in web/dist (python build_assets.py):
+precompiled Tailwind CSS, local fonts, canvas-confetti and the About icon,
+loaded from disk through the page's base URI. A source checkout without a
+build falls back to the CDNs, including Tailwind's in-browser compiler, and
+to an inline copy of the icon.
+"""
+
+import base64
+import json
+import os
+from pathlib import Path
+
+from app_paths import resource_path
+
+LOCAL_FILES = ("app.css", "fonts.css", "confetti.browser.min.js")
+# About-box icon (python process_icon.py), copied into web/dist by the build
+APP_ICON = "app_icon.png"
+
+CDN_HEAD = """<link href="https://fonts.googleapis.com/css2?family=Space+Grotesk:wght@300;400;500;600;700&amp;display=swap" rel="stylesheet"/>
+<link href="https://fonts.googleapis.com/css2?family=Material+Symbols+Outlined:wght,FILL@100..700,0..1&amp;display=swap" rel="stylesheet"/>
+<script src="https://cdn.tailwindcss.com?plugins=forms,container-queries"></script>
+<script src="https://cdn.jsdelivr.net/npm/canvas-confetti@1.9.2/dist/confetti.browser.min.js"></script>
+<script id="tailwind-config">tailwind.config = {darkMode: "class", theme: {extend: %s}};</script>"""
+
+LOCAL_HEAD = """<link href="fonts.css" rel="stylesheet"/>
+<link href="app.css" rel="stylesheet"/>
+<script src="confetti.browser.min.js" defer></script>"""
+
+
+def dist_dir():
+    return resource_path(os.path.join("web", "dist"))
+
+
+def is_built():
+    directory = dist_dir()
+    return all(os.path.exists(os.path.join(directory, name)) for name in LOCAL_FILES)
+
+
+def head_html():
+    """<head> tags for the main window: local bundle when built, CDN otherwise."""
+    if is_built():
+        return LOCAL_HEAD
+    print("DEBUG: web/dist not built (python build_assets.py), loading UI assets from CDNs")
+    try:
+        with open(resource_path(os.path.join("web", "theme.json")), encoding="utf-8") as f:
+            theme = json.dumps(json.load(f))
+    except Exception as e:
+        print(f"DEBUG: Could not read web/theme.json: {e}")
+        theme = "{}"
+    return CDN_HEAD % theme
+
+
+def base_uri():
+    """file:// URI relative asset references in the main HTML resolve against."""
+    return Path(dist_dir()).as_uri() + "/"
+
+
+def app_icon_src():
+    """<img> src of the About icon: the bundled file next to the CSS, inline in an unbuilt checkout."""
+    if os.path.exists(os.path.join(dist_dir(), APP_ICON)):
+        return APP_ICON
+    try:
+        with open(resource_path(APP_ICON), "rb") as f:
+            return "data:image/png;base64," + base64.b64encode(f.read()).decode("ascii")
+    except OSError as e:
+        print(f"DEBUG: About icon not found: {e}")
+        return None
+
+
+def mode():
+    return "local" if is_built() else "cdn"